@@ -6,16 +6,22 @@ https://github.com/ambientika/HomeAssistant-integration-for-Ambientika
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from datetime import timedelta
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .hub import AmbientikaHub
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .hub import AmbientikaHub, AmbientikaZoneCoordinator
 
 # Optional enhanced hub for advanced zone management features
 try:
@@ -39,17 +45,26 @@ DIAGNOSTIC_PLATFORMS: list[Platform] = [
     Platform.SENSOR,  # For diagnostic_sensor.py
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Service schemas
 SYNC_ZONES_SCHEMA = vol.Schema({
     vol.Optional("entry_id"): cv.string,
     vol.Optional("force_resync", default=False): cv.boolean,
     vol.Optional("create_missing_floors", default=True): cv.boolean,
     vol.Optional("create_missing_areas", default=True): cv.boolean,
-})
+}, extra=vol.PREVENT_EXTRA)
 
 GET_ZONE_STATUS_SCHEMA = vol.Schema({
     vol.Optional("entry_id"): cv.string,
-})
+}, extra=vol.PREVENT_EXTRA)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration and its services once for all config entries."""
+    hass.data.setdefault(DOMAIN, {})
+    _register_zone_sync_services(hass)
+    return True
 
 
 # TODO: can we reduce the frequency of api calls for bad devices?
@@ -62,12 +77,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # For testing purposes, enable enhanced hub if available
     use_enhanced_hub = ENHANCED_HUB_AVAILABLE  # Temporarily force enhanced hub for testing
 
+    # A single coordinator polls the API for all entities, at the interval set in the options
+    update_interval = timedelta(
+        seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
+
     if use_enhanced_hub:
         _LOGGER.info("Using Enhanced Ambientika Hub with zone management features")
-        hub = EnhancedAmbientikaHub(hass=hass, config=entry.data)
+        hub = EnhancedAmbientikaHub(hass=hass, config=entry.data, update_interval=update_interval)
     else:
         _LOGGER.info("Using standard Ambientika Hub")
-        hub = AmbientikaHub(hass=hass, config=entry.data)
+        hub = AmbientikaHub(hass=hass, config=entry.data, update_interval=update_interval)
 
     await hub.login()
     hass.data[DOMAIN][entry.entry_id] = hub
@@ -75,75 +95,98 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     await hub.async_config_entry_first_refresh()
 
+    # Diagnostic sensors follow the zone topology, which rarely changes
+    hub.zone_coordinator = AmbientikaZoneCoordinator(hass, hub)
+    entry.async_on_unload(hub.async_add_listener(hub.zone_coordinator.async_handle_hub_update))
+
+    # The config flow only checks the credentials, so report an empty account here
+    issue_id = f"no_devices_{entry.entry_id}"
+    if hub.devices:
+        ir.async_delete_issue(hass, DOMAIN, issue_id)
+    else:
+        ir.async_create_issue(
+            hass,
+            DOMAIN,
+            issue_id,
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key="no_devices",
+            translation_placeholders={"username": entry.data[CONF_USERNAME]},
+        )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    # Register zone sync services
-    await _register_zone_sync_services(hass)
-
     return True
 
 
-async def _register_zone_sync_services(hass: HomeAssistant) -> None:
+def _register_zone_sync_services(hass: HomeAssistant) -> None:
     """Register zone synchronization services."""
     try:
-        # Only register if not already registered and zone sync is available
-        if not hass.services.has_service(DOMAIN, "sync_zones"):
-            hass.services.async_register(
-                DOMAIN,
-                "sync_zones",
-                _handle_sync_zones_service,
-                schema=SYNC_ZONES_SCHEMA,
-            )
-            _LOGGER.debug("Registered sync_zones service")
-
-        if not hass.services.has_service(DOMAIN, "get_zone_status"):
-            hass.services.async_register(
-                DOMAIN,
-                "get_zone_status",
-                _handle_get_zone_status_service,
-                schema=GET_ZONE_STATUS_SCHEMA,
-            )
-            _LOGGER.debug("Registered get_zone_status service")
+        hass.services.async_register(
+            DOMAIN,
+            "sync_zones",
+            _handle_sync_zones_service,
+            schema=SYNC_ZONES_SCHEMA,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "get_zone_status",
+            _handle_get_zone_status_service,
+            schema=GET_ZONE_STATUS_SCHEMA,
+        )
+        _LOGGER.debug("Registered zone sync services")
 
     except Exception as e:
         _LOGGER.error("Failed to register zone sync services: %s", e)
 
 
+def _get_zone_sync_managers(call: ServiceCall) -> list[tuple[str, Any]]:
+    """Return the (entry_id, zone sync manager) pairs targeted by a service call."""
+    zone_sync_data = call.hass.data.get(DOMAIN, {}).get('zone_sync', {})
+
+    if not zone_sync_data:
+        _LOGGER.warning("No zone sync managers available")
+        return []
+
+    entry_id = call.data.get("entry_id")
+    if not entry_id:
+        return list(zone_sync_data.items())
+
+    if (zone_sync := zone_sync_data.get(entry_id)) is None:
+        _LOGGER.warning("Zone sync manager not found for entry %s", entry_id)
+        return []
+
+    return [(entry_id, zone_sync)]
+
+
 async def _handle_sync_zones_service(call: ServiceCall) -> None:
     """Handle the sync_zones service call."""
     try:
-        entry_id = call.data.get("entry_id")
-        force_resync = call.data.get("force_resync", False)
-        create_missing_floors = call.data.get("create_missing_floors", True)
-        create_missing_areas = call.data.get("create_missing_areas", True)
-
-        # Get zone sync managers
-        zone_sync_data = call.hass.data.get(DOMAIN, {}).get('zone_sync', {})
-
-        if not zone_sync_data:
-            _LOGGER.warning("No zone sync managers available")
-            return
-
-        # Sync specific entry or all entries
-        entries_to_sync = [entry_id] if entry_id else list(zone_sync_data.keys())
-
-        results = {}
-        for sync_entry_id in entries_to_sync:
-            zone_sync = zone_sync_data.get(sync_entry_id)
-            if zone_sync:
-                # Update configuration if provided
-                zone_sync._create_missing_floors = create_missing_floors
-                zone_sync._create_missing_areas = create_missing_areas
-
-                if force_resync:
-                    zone_sync._last_full_sync = None
-
-                result = await zone_sync.async_sync_zones()
-                results[sync_entry_id] = result
-                _LOGGER.info("Zone sync completed for entry %s: %s", sync_entry_id, result.get("status"))
+        # Defaults are filled in by SYNC_ZONES_SCHEMA before the handler runs
+        data = call.data
+        force_resync = data["force_resync"]
+        create_missing_floors = data["create_missing_floors"]
+        create_missing_areas = data["create_missing_areas"]
+
+        # Sync specific entry or all entries concurrently
+        tasks = {}
+        for sync_entry_id, zone_sync in _get_zone_sync_managers(call):
+            # Update configuration if provided
+            zone_sync._create_missing_floors = create_missing_floors
+            zone_sync._create_missing_areas = create_missing_areas
+
+            if force_resync:
+                zone_sync._last_full_sync = None
+
+            tasks[sync_entry_id] = zone_sync.async_sync_zones()
+
+        results = dict(zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True)))
+        for sync_entry_id, result in results.items():
+            if isinstance(result, Exception):
+                _LOGGER.error("Zone sync failed for entry %s: %s", sync_entry_id, result)
             else:
-                _LOGGER.warning("Zone sync manager not found for entry %s", sync_entry_id)
+                _LOGGER.info("Zone sync completed for entry %s: %s", sync_entry_id, result.get("status"))
 
     except Exception as e:
         _LOGGER.error("Error in sync_zones service: %s", e)
@@ -152,27 +195,12 @@ async def _handle_sync_zones_service(call: ServiceCall) -> None:
 async def _handle_get_zone_status_service(call: ServiceCall) -> None:
     """Handle the get_zone_status service call."""
     try:
-        entry_id = call.data.get("entry_id")
-
-        # Get zone sync managers
-        zone_sync_data = call.hass.data.get(DOMAIN, {}).get('zone_sync', {})
-
-        if not zone_sync_data:
-            _LOGGER.warning("No zone sync managers available")
-            return
-
         # Get status for specific entry or all entries
-        entries_to_check = [entry_id] if entry_id else list(zone_sync_data.keys())
-
         status_results = {}
-        for sync_entry_id in entries_to_check:
-            zone_sync = zone_sync_data.get(sync_entry_id)
-            if zone_sync:
-                status = zone_sync.get_sync_status()
-                status_results[sync_entry_id] = status
-                _LOGGER.debug("Zone sync status for entry %s: %s", sync_entry_id, status.get("zone_mappings_count", 0))
-            else:
-                _LOGGER.warning("Zone sync manager not found for entry %s", sync_entry_id)
+        for sync_entry_id, zone_sync in _get_zone_sync_managers(call):
+            status = zone_sync.get_sync_status()
+            status_results[sync_entry_id] = status
+            _LOGGER.debug("Zone sync status for entry %s: %s", sync_entry_id, status.get("zone_mappings_count", 0))
 
         # Log the combined status
         _LOGGER.info("Zone sync status retrieved for %d entries", len(status_results))
@@ -188,6 +216,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hub = hass.data[DOMAIN].pop(entry.entry_id)
         await hub.async_unload()
+        ir.async_delete_issue(hass, DOMAIN, f"no_devices_{entry.entry_id}")
 
         # Clean up zone sync data
         if 'zone_sync' in hass.data.get(DOMAIN, {}):
@@ -198,5 +227,4 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    hass.config_entries.async_schedule_reload(entry.entry_id)
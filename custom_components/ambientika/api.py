@@ -6,19 +6,28 @@ Ambientika API: https://app.ambientika.eu:4521/swagger/index.html.
 
 import logging
 import asyncio
+import contextlib
+import copy
+import time
 import aiohttp
 
-from ambientika_py import authenticate, Device
-from returns.result import Failure
+from ambientika_py import authenticate, parse_response_body, Device
+from returns.result import Failure, Success
 from returns.primitives.exceptions import UnwrapFailedError
 
-from .const import AmbientikaApiClientAuthenticationError, AmbientikaApiClientError, DEFAULT_HOST
+from .const import (
+    AmbientikaApiClientAuthenticationError,
+    AmbientikaApiClientError,
+    AmbientikaApiClientRateLimitError,
+    DEFAULT_HOST,
+)
 
 LOGGER = logging.getLogger(__name__)
 
-
-class AmbientikaApiClientError(Exception):
-    """Exception to indicate a general API error."""
+# Circuit breaker for authentication: open after this many consecutive failures...
+AUTH_FAILURE_THRESHOLD = 3
+# ...and keep it open for this many seconds
+AUTH_BREAKER_TIMEOUT = 300
 
 
 class AmbientikaApiClient:
@@ -31,14 +40,16 @@ class AmbientikaApiClient:
         self._host = DEFAULT_HOST
         self._api_client = None
         self._session: aiohttp.ClientSession | None = None
-        self._connector = aiohttp.TCPConnector(
-            limit=5,              # Reduced concurrent connections to avoid overwhelming the server
-            limit_per_host=1,     # Only 1 connection per host to reduce server load
-            ttl_dns_cache=300,    # Cache DNS lookups for 5 minutes
-            enable_cleanup_closed=True,
-            force_close=False,    # Enable keep-alive
-            keepalive_timeout=60  # Keep connections alive for 60 seconds
-        )
+        self._auth_task: asyncio.Task | None = None
+        self._fetch_task: asyncio.Task | None = None
+        self.houses: tuple = ()  # Houses of the last fetch, with their rooms and zones
+        # (path, query) -> (ETag, body) of GET responses, for conditional requests
+        self._etag_cache: dict[tuple, tuple[str, object]] = {}
+        self._auth_failures = 0
+        self._last_auth_error: AmbientikaApiClientError | None = None
+        self._breaker_open_until = 0.0
+        # Created lazily in _authenticate so it binds to the running event loop
+        self._connector: aiohttp.TCPConnector | None = None
 
         # Configure much longer timeouts to handle slow server responses
         self._timeout = aiohttp.ClientTimeout(
@@ -49,110 +60,163 @@ class AmbientikaApiClient:
         )
 
     async def _ensure_client(self):
-        """Ensure we have an authenticated API client."""
-        if self._api_client is None:
-            LOGGER.debug("Authenticating with Ambientika API.")
-
-            # Create persistent session with timeout and connection pooling
-            if self._session is None or self._session.closed:
-                self._session = aiohttp.ClientSession(
-                    timeout=self._timeout,
-                    connector=self._connector,
-                    headers={
-                        "Connection": "keep-alive",
-                        "User-Agent": "HomeAssistant-Ambientika/1.0"
-                    }
-                )
+        """Ensure we have an authenticated API client.
+
+        Concurrent callers share a single authentication attempt. After repeated
+        failures the circuit breaker opens and callers fail fast until it expires.
+        """
+        if self._api_client is not None:
+            return
 
-            max_retries = 2  # Reduced retries to fail faster with long timeouts
-            retry_count = 0
-            last_error = None
+        if self._last_auth_error is not None and time.monotonic() < self._breaker_open_until:
+            LOGGER.debug("Authentication circuit breaker is open, not contacting the API.")
+            raise self._last_auth_error
+
+        if self._auth_task is None or self._auth_task.done():
+            self._auth_task = asyncio.create_task(self._authenticate_once())
+
+        # Shield the shared task so a cancelled caller does not abort it for the others
+        await asyncio.shield(self._auth_task)
+
+    async def _authenticate_once(self):
+        """Run one authentication attempt and track consecutive failures."""
+        try:
+            await self._authenticate()
+        except AmbientikaApiClientError as e:
+            self._auth_failures += 1
+            self._last_auth_error = e
+            if self._auth_failures >= AUTH_FAILURE_THRESHOLD:
+                self._breaker_open_until = time.monotonic() + AUTH_BREAKER_TIMEOUT
+                LOGGER.warning(
+                    "Authentication failed %d times in a row, pausing attempts for %d seconds",
+                    self._auth_failures,
+                    AUTH_BREAKER_TIMEOUT,
+                )
+            raise
+        self._auth_failures = 0
+        self._last_auth_error = None
+        self._breaker_open_until = 0
+
+    async def _authenticate(self):
+        """Authenticate and set up the API client, retrying on connection errors."""
+        LOGGER.debug("Authenticating with Ambientika API.")
+
+        # Create persistent session with timeout and connection pooling
+        if self._session is None or self._session.closed:
+            # Closing the session also closes the connector it owns
+            if self._connector is None or self._connector.closed:
+                self._connector = aiohttp.TCPConnector(
+                    limit=5,              # Reduced concurrent connections to avoid overwhelming the server
+                    limit_per_host=4,     # Lets the per-device status requests of a refresh run concurrently
+                    ttl_dns_cache=300,    # Cache DNS lookups for 5 minutes
+                    enable_cleanup_closed=True,
+                    force_close=False,    # Enable keep-alive
+                    keepalive_timeout=60  # Keep connections alive for 60 seconds
+                )
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                connector=self._connector,
+                headers={
+                    "Connection": "keep-alive",
+                    "User-Agent": "HomeAssistant-Ambientika/1.0"
+                }
+            )
+
+        max_retries = 2  # Reduced retries to fail faster with long timeouts
+        retry_count = 0
+        last_error = None
+
+        while retry_count < max_retries:
+            try:
+                authenticator = await authenticate(
+                    self._username, self._password, self._host
+                )
 
-            while retry_count < max_retries:
-                try:
-                    authenticator = await authenticate(
-                        self._username, self._password, self._host
+                # Handle authentication failure
+                if isinstance(authenticator, Failure):
+                    error_msg = str(authenticator.failure())
+                    raise AmbientikaApiClientAuthenticationError(
+                        f"Authentication failed: {error_msg}"
                     )
 
-                    # Handle authentication failure
-                    if isinstance(authenticator, Failure):
-                        error_msg = str(authenticator.failure())
-                        raise AmbientikaApiClientAuthenticationError(
-                            f"Authentication failed: {error_msg}"
-                        )
-
-                    self._api_client = authenticator.unwrap()
-
-                    # CRITICAL FIX: Replace the session in the underlying API to use our persistent session
-                    # This prevents the library from creating new sessions for every API call
-                    if hasattr(self._api_client, '_api') and self._session:
-                        # Store original session cleanup function
-                        original_session = getattr(self._api_client._api, '_session', None)
-
-                        # Monkey-patch the API methods to use our persistent session
-                        self._patch_api_methods(self._api_client._api)
-
-                        # Clean up the original session if it exists
-                        if original_session and original_session != self._session:
-                            try:
-                                await original_session.close()
-                            except Exception as e:
-                                LOGGER.warning(f"Error closing original session: {str(e)}")
-
-                    # Successfully set up client, break the retry loop
-                    break
-
-                except (TimeoutError, aiohttp.ClientError) as e:
-                    last_error = e
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        wait_time = min(5 + retry_count * 3, 15)  # Longer backoff: 5s, 8s, 11s...
-                        LOGGER.warning(f"Authentication attempt {retry_count} failed: {str(e)}. Retrying in {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                        continue
-
-                    # Clean up session on final failure
-                    if self._session and not self._session.closed:
-                        await self._session.close()
-                        self._session = None
-                    self._api_client = None
-                    raise AmbientikaApiClientError(f"Connection failed after {max_retries} attempts: {str(last_error)}")
-                except Exception as e:
-                    # Clean up session on unexpected error
-                    if self._session and not self._session.closed:
-                        await self._session.close()
-                        self._session = None
-                    self._api_client = None
-                    if isinstance(e, AmbientikaApiClientAuthenticationError):
-                        raise
-                    raise AmbientikaApiClientError(f"Failed to setup API client: {str(e)}")
+                self._api_client = authenticator.unwrap()
+
+                # CRITICAL FIX: Replace the session in the underlying API to use our persistent session
+                # This prevents the library from creating new sessions for every API call
+                if hasattr(self._api_client, '_api') and self._session:
+                    # Store original session cleanup function
+                    original_session = getattr(self._api_client._api, '_session', None)
+
+                    # Monkey-patch the API methods to use our persistent session
+                    self._patch_api_methods(self._api_client._api)
+
+                    # Clean up the original session if it exists
+                    if original_session and original_session != self._session:
+                        try:
+                            await original_session.close()
+                        except Exception as e:
+                            LOGGER.warning("Error closing original session: %s", e)
+
+                # Successfully set up client, break the retry loop
+                break
+
+            except (TimeoutError, aiohttp.ClientError) as e:
+                last_error = e
+                retry_count += 1
+                if retry_count < max_retries:
+                    wait_time = min(5 + retry_count * 3, 15)  # Longer backoff: 5s, 8s, 11s...
+                    LOGGER.warning("Authentication attempt %d failed: %s. Retrying in %d seconds...", retry_count, e, wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                # Clean up session on final failure
+                if self._session and not self._session.closed:
+                    await self._session.close()
+                    self._session = None
+                self._api_client = None
+                raise AmbientikaApiClientError(f"Connection failed after {max_retries} attempts: {last_error}")
+            except Exception as e:
+                # Clean up session on unexpected error
+                if self._session and not self._session.closed:
+                    await self._session.close()
+                    self._session = None
+                self._api_client = None
+                if isinstance(e, AmbientikaApiClientAuthenticationError):
+                    raise
+                raise AmbientikaApiClientError(f"Failed to setup API client: {e}")
 
     def _patch_api_methods(self, api):
         """Patch the AmbientikaApi methods to use our persistent session."""
-        original_get = api.get
-        original_post = api.post
+        etag_cache = self._etag_cache
 
         async def patched_get(path: str, params: dict = None):
             if params is None:
                 params = {}
             headers = {"Authorization": f"Bearer {api.token}"}
 
+            # Ask the server to skip the body if it did not change since the last response
+            cache_key = (path, tuple(sorted(params.items())))
+            if cached := etag_cache.get(cache_key):
+                headers["If-None-Match"] = cached[0]
+
             try:
                 async with self._session.get(
                     url=f"{api.host}/{path}",
                     headers=headers,
                     params=params
                 ) as response:
-                    from ambientika_py import parse_response_body
+                    # Callers may change the body they get, so the cache keeps a copy of its own
+                    if response.status == 304 and cached:
+                        LOGGER.debug("%s not modified, reusing the previous response", path)
+                        return Success(copy.deepcopy(cached[1]))
                     data = await parse_response_body(response)
                     if response.status == 200:
-                        from returns.result import Success
+                        if etag := response.headers.get("ETag"):
+                            etag_cache[cache_key] = (etag, copy.deepcopy(data))
                         return Success(data)
                     else:
-                        from returns.result import Failure
                         return Failure({"status_code": response.status, "data": data})
             except Exception as e:
-                from returns.result import Failure
                 return Failure({"status_code": 0, "data": str(e)})
 
         async def patched_post(path: str, body: dict):
@@ -164,126 +228,134 @@ class AmbientikaApiClient:
                     headers=headers,
                     json=body
                 ) as response:
-                    from ambientika_py import parse_response_body
                     data = await parse_response_body(response)
                     if response.status == 200:
-                        from returns.result import Success
                         return Success(data)
                     else:
-                        from returns.result import Failure
                         return Failure({"status_code": response.status, "data": data})
             except Exception as e:
-                from returns.result import Failure
                 return Failure({"status_code": 0, "data": str(e)})
 
         # Replace the methods
         api.get = patched_get
         api.post = patched_post
 
+    async def async_test_auth(self) -> None:
+        """Verify the credentials by authenticating, without fetching any devices."""
+        await self._ensure_client()
 
-    async def async_get_data(self) -> list[Device]:
+    async def async_get_data(self) -> tuple[Device, ...]:
         """Get all devices from the API.
 
         The devices are flattened. Meaning, the information about rooms and houses is not made available to hass.
+        Concurrent callers (coordinator refresh, services) share a single in-flight request,
+        so the result is an immutable tuple they can all hold on to.
         """
+        if self._fetch_task is None or self._fetch_task.done():
+            self._fetch_task = asyncio.create_task(self._async_fetch_devices())
+
+        return await asyncio.shield(self._fetch_task)
+
+    async def _async_fetch_devices(self) -> tuple[Device, ...]:
+        """Fetch the houses and extract their devices."""
         try:
             await self._ensure_client()
             LOGGER.debug("fetching houses.")
 
             houses = await self._api_client.houses()
             if isinstance(houses, Failure):
-                error_msg = str(houses.failure())
-                LOGGER.error(f"Failed to fetch houses: {error_msg}")
+                failure = houses.failure()
+                if isinstance(failure, dict) and failure.get("status_code") == 429:
+                    # Keep the session, the credentials are fine - we just have to slow down
+                    raise AmbientikaApiClientRateLimitError(f"Ambientika API rate limit reached: {failure}")
+                error_msg = str(failure)
+                LOGGER.error("Failed to fetch houses: %s", error_msg)
                 await self._cleanup()  # Force re-auth on next try
                 raise AmbientikaApiClientError(f"Ambientika API error: {error_msg}")
 
             try:
                 house_list = houses.unwrap()
+                self.houses = tuple(house_list or ())
                 if not house_list:
                     LOGGER.warning("No houses found in the response")
-                    return []
-
-                LOGGER.debug(f"Found {len(house_list)} houses")
+                    return ()
+
+                LOGGER.debug("Found %d houses", len(house_list))
+                for house in filter(None, house_list):
+                    if getattr(house, 'rooms', None) is None:
+                        LOGGER.warning("House %s has no rooms attribute", house.name)
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    # Per house/room details are only walked when debug logging is on
+                    for house in filter(None, house_list):
+                        rooms = getattr(house, 'rooms', None) or ()
+                        LOGGER.debug("Processing house: %s with %d rooms", house.name, len(rooms))
+                        for room in filter(None, rooms):
+                            LOGGER.debug(
+                                "Processing room: %s with %d devices",
+                                room.name,
+                                len(getattr(room, 'devices', None) or ()),
+                            )
 
                 # Extract all devices from all houses and rooms
-                devices = []
-                for house in house_list:
-                    if not house:
-                        continue
-
-                    LOGGER.debug(f"Processing house: {house.name}")
-                    if not hasattr(house, 'rooms'):
-                        LOGGER.warning(f"House {house.name} has no rooms attribute")
-                        continue
-
-                    for room in house.rooms:
-                        if not room:
-                            continue
-
-                        LOGGER.debug(f"Processing room: {room.name} with {len(room.devices) if hasattr(room, 'devices') else 0} devices")
-                        if hasattr(room, 'devices'):
-                            devices.extend([d for d in room.devices if d])
+                devices = tuple(
+                    device
+                    for house in house_list if house
+                    for room in getattr(house, 'rooms', None) or () if room
+                    for device in getattr(room, 'devices', None) or () if device
+                )
 
-                LOGGER.debug(f"Total devices found: {len(devices)}")
+                LOGGER.debug("Total devices found: %d", len(devices))
                 return devices
 
             except UnwrapFailedError as e:
-                LOGGER.error(f"Failed to unwrap houses response: {e}")
+                LOGGER.error("Failed to unwrap houses response: %s", e)
                 await self._cleanup()
                 raise AmbientikaApiClientError("Failed to process houses data")
 
+        except AmbientikaApiClientError:
+            # Already classified (authentication, rate limit, API error)
+            raise
         except aiohttp.ClientError as exception:
-            LOGGER.error(f"Connection error: {str(exception)}")
+            LOGGER.error("Connection error: %s", exception)
             await self._cleanup()  # Force re-auth on next try
             raise AmbientikaApiClientError(
-                f"Connection error: {str(exception)}"
+                f"Connection error: {exception}"
             ) from exception
         except aiohttp.ServerTimeoutError as exception:
-            LOGGER.error(f"Server timeout error: {str(exception)}")
+            LOGGER.error("Server timeout error: %s", exception)
             await self._cleanup()  # Force re-auth on next try
             raise AmbientikaApiClientError(
-                f"Server timeout: {str(exception)}"
+                f"Server timeout: {exception}"
             ) from exception
         except TimeoutError as exception:
-            LOGGER.error(f"Request timeout error: {str(exception)}")
+            LOGGER.error("Request timeout error: %s", exception)
             await self._cleanup()  # Force re-auth on next try
             raise AmbientikaApiClientError(
-                f"Request timeout: {str(exception)}"
+                f"Request timeout: {exception}"
             ) from exception
         except Exception as exception:
-            LOGGER.error(f"Unknown error: {str(exception)}")
+            LOGGER.error("Unknown error: %s", exception)
             await self._cleanup()  # Force re-auth on next try
-            raise AmbientikaApiClientError(f"Unknown error: {str(exception)}") from exception
+            raise AmbientikaApiClientError(f"Unknown error: {exception}") from exception
 
-    async def _cleanup(self):
-        """Internal cleanup of resources."""
-        try:
-            # Clean up the API client first
-            if self._api_client:
-                self._api_client = None
+    async def _cleanup(self, close_connector: bool = False):
+        """Internal cleanup of resources.
 
-            # Clean up our persistent session
-            if self._session and not self._session.closed:
-                try:
-                    await self._session.close()
-                except Exception as e:
-                    LOGGER.warning(f"Error closing persistent session: {str(e)}")
-                finally:
-                    self._session = None
+        Closing the session also closes the connector it owns; `close_connector` makes
+        sure the connector is released even if no session was ever created.
+        """
+        self._api_client = None
+
+        # Teardown is best effort, a failing close must not mask the original error
+        if self._session and not self._session.closed:
+            with contextlib.suppress(Exception):
+                await self._session.close()
+        self._session = None
 
-        except Exception as e:
-            LOGGER.error(f"Error during cleanup: {str(e)}")
-        finally:
-            self._api_client = None
-            self._session = None
+        if close_connector and self._connector and not self._connector.closed:
+            with contextlib.suppress(Exception):
+                await self._connector.close()
 
     async def close(self):
         """Close the API client and cleanup resources."""
-        await self._cleanup()
-
-        # Also close the connector
-        if self._connector and not self._connector.closed:
-            try:
-                await self._connector.close()
-            except Exception as e:
-                LOGGER.warning(f"Error closing connector: {str(e)}")
+        await self._cleanup(close_connector=True)
@@ -5,12 +5,12 @@ from __future__ import annotations
 from ambientika_py import Device
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, MANUFACTURER, MODEL
 from .hub import AmbientikaHub
 
 
@@ -22,55 +22,52 @@ async def async_setup_entry(
 
     # TODO: this could be simplified with ENTITY_DESCTIPTIONS, but requires event subscription
     # https://github.com/DeebotUniverse/Deebot-4-Home-Assistant/blob/dev/custom_components/deebot/sensor.py#L79
-    async_add_entities(HumidityAlarmBinarySensor(hub, device) for device in hub.devices)
-    async_add_entities(NightAlarmBinarySensor(hub, device) for device in hub.devices)
+    async_add_entities(
+        sensor
+        for device in hub.devices
+        for sensor in (HumidityAlarmBinarySensor(hub, device), NightAlarmBinarySensor(hub, device))
+    )
 
 
 class BinarySensorBase(CoordinatorEntity, BinarySensorEntity):
     """Base representation of an Ambientika Binary Sensor."""
 
     _attr_should_poll = False  # Coordinator handles updates
+    _attr_icon = "mdi:alarm-light"
 
     def __init__(self, coordinator: AmbientikaHub, device: Device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._device = device
         self._serial = device.serial_number
-
-    @property
-    def device_info(self):
-        """Return information to link this entity with the correct device."""
-        return {
+        self._coordinator_device = coordinator.devices_by_serial.get(self._serial)
+        # Link this entity with the correct device
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, self._serial)},
-            "name": self._device.name,
-            "manufacturer": "SUEDWIND",
-            "model": "Ambientika",
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
             "serial_number": self._serial,
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Look up our device once per refresh before writing the state."""
+        self._coordinator_device = self.coordinator.devices_by_serial.get(self._serial)
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.data:
-            return False
-        # Find our device in the coordinator's data
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                return True
-        return False
+        return bool(self.coordinator.data) and self._coordinator_device is not None
 
     @property
     def device_status(self):
         """Get the current device status from coordinator data."""
-        if not self.coordinator.data:
+        if not self.coordinator.data or self._coordinator_device is None:
             return None
-
-        # Find our device in the coordinator's current data
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                # Get the current status without making an API call
-                return device.current_status if hasattr(device, 'current_status') else None
-        return None
+        # Get the current status without making an API call
+        return self.coordinator.status_by_serial.get(self._serial)
 
 
 class HumidityAlarmBinarySensor(BinarySensorBase):
@@ -78,13 +75,12 @@ class HumidityAlarmBinarySensor(BinarySensorBase):
 
     _attr_has_entity_name = True
     _attr_translation_key = "humidity_alarm"
-    _attr_icon = "mdi:alarm-light"
 
     def __init__(self, coordinator: AmbientikaHub, device: Device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_humidity_alarm"
-        LOGGER.debug(f"Creating HumidityAlarmBinarySensor: {self._device.name}")
+        LOGGER.debug("Creating HumidityAlarmBinarySensor: %s", self._device.name)
 
     @property
     def is_on(self) -> bool | None:
@@ -101,13 +97,12 @@ class NightAlarmBinarySensor(BinarySensorBase):
 
     _attr_has_entity_name = True
     _attr_translation_key = "night_alarm"
-    _attr_icon = "mdi:alarm-light"
 
     def __init__(self, coordinator: AmbientikaHub, device: Device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_night_alarm"
-        LOGGER.debug(f"Creating NightAlarmBinarySensor: {self._device.name}")
+        LOGGER.debug("Creating NightAlarmBinarySensor: %s", self._device.name)
 
     @property
     def is_on(self) -> bool | None:
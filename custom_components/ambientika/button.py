@@ -18,7 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from returns.result import Failure, Success
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, MANUFACTURER, MODEL
 from .hub import AmbientikaHub
 
 
@@ -52,16 +52,12 @@ class FilterResetButton(ButtonEntity):
         self._device = device
         self._hub = hub
         self._attr_unique_id = f"{self._device.serial_number}_filter_reset"
-
-    @property
-    def device_info(self):
-        # TODO: move this to a common base class shared with other entity files
-        """Return information to link this entity with the correct device."""
-        return {
+        # Link this entity with the correct device
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, self._device.serial_number)},
             "name": self._device.name,
-            "manufacturer": "SUEDWIND",
-            "model": "Ambientika",
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
             "serial_number": self._device.serial_number,
         }
 
@@ -72,8 +68,10 @@ class FilterResetButton(ButtonEntity):
             "button",
             self._device.serial_number,
         )
-        response = await self._device.api.get(
-            "device/reset-filter", {"deviceSerialNumber": self._device.serial_number}
+        # The hub's device of the last refresh uses the current API client
+        device = self._hub.devices_by_serial.get(self._device.serial_number, self._device)
+        response = await device.api.get(
+            "device/reset-filter", {"deviceSerialNumber": device.serial_number}
         )
         match response:
             case Success(data):
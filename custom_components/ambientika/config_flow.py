@@ -8,7 +8,8 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
@@ -17,7 +18,7 @@ from .api import (
     AmbientikaApiClientAuthenticationError,
     AmbientikaApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER, MAX_SCAN_INTERVAL, MIN_SCAN_INTERVAL
 
 # Configuration keys for zone sync settings
 CONF_SYNC_ZONES_TO_FLOORS = "sync_zones_to_floors"
@@ -34,6 +35,14 @@ class AmbientikaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._user_input = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> AmbientikaOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return AmbientikaOptionsFlowHandler()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -43,7 +52,7 @@ class AmbientikaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                devices = await _test_pairing(
+                await _test_pairing(
                     user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
                 )
             except AmbientikaApiClientAuthenticationError as exception:
@@ -57,9 +66,6 @@ class AmbientikaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
             if not errors:
-                if len(devices) == 0:
-                    return self.async_abort(reason="no_supported_devices_found")
-
                 # Store credentials and proceed to zone sync settings
                 self._user_input = user_input
                 return await self.async_step_zone_sync()
@@ -124,6 +130,43 @@ class AmbientikaFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
-async def _test_pairing(username, password) -> list:
+class AmbientikaOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options Flow Class."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> FlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL,
+                            max=MAX_SCAN_INTERVAL,
+                            step=1,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                }
+            ),
+        )
+
+
+async def _test_pairing(username, password) -> None:
     client = AmbientikaApiClient(username, password)
-    return await client.async_get_data()
+    try:
+        await client.async_test_auth()
+    finally:
+        await client.close()
@@ -14,12 +14,41 @@ class AmbientikaApiClientError(Exception):
 class AmbientikaApiClientAuthenticationError(AmbientikaApiClientError):
     """Exception to indicate an authentication error."""
 
+
+class AmbientikaApiClientRateLimitError(AmbientikaApiClientError):
+    """Exception to indicate the API rejected a request with HTTP 429."""
+
 NAME = "Ambientika"
 DOMAIN = "ambientika"
 VERSION = "1.0.0"
 
+# Device registry details shared by all entities
+MANUFACTURER = "SUEDWIND"
+MODEL = "Ambientika"
+
 DEFAULT_HOST = "https://app.ambientika.eu:4521"  # This is the default from ambientika_py. I am not aware of other values yet.
 
+# Polling interval in seconds, configurable through the options flow
+DEFAULT_SCAN_INTERVAL = 300
+MIN_SCAN_INTERVAL = 30
+MAX_SCAN_INTERVAL = 3600  # Upper bound when backing off after rate limiting
+
+# Polling slows down after this many refreshes without any device change
+IDLE_REFRESHES_BEFORE_SLOWDOWN = 3
+MAX_IDLE_SCAN_INTERVAL = 900  # Upper bound for the idle slowdown
+
+# Device status requests running at once during a refresh (matches the connection pool)
+MAX_PARALLEL_STATUS_REQUESTS = 4
+
+# Seconds to wait for further setting changes on a device before sending them in one change_mode call
+MODE_CHANGE_DEBOUNCE = 0.25
+MODE_CHANGE_CONFIRM_DELAY = 3  # Seconds before reading back the status after a change
+MAX_MODE_CHANGE_CONFIRM_DELAY = 24  # The delay doubles while the device does not report the change yet
+
+# Lowercased device roles as reported by the API
+MASTER_ROLES = frozenset({"master"})
+SLAVE_ROLES = frozenset({"slave", "slaveequalmaster", "slaveoppositemaster"})
+
 # ORDERED_NAMED_FAN_SPEEDS = [name for name, _ in FanSpeed.__members__.items()]
 # ORDERED_NAMED_HUMIDITY_LEVELS = [name for name, _ in HumidityLevel.__members__.items()]
 
@@ -6,15 +6,17 @@ for Ambientika devices, showing master/slave relationships and zone assignments.
 
 from __future__ import annotations
 
+from typing import Any
+
 from ambientika_py import Device
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity, EntityCategory
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER
-from .hub import AmbientikaHub
+from .const import DOMAIN, LOGGER, MANUFACTURER, MODEL
+from .hub import AmbientikaHub, AmbientikaZoneCoordinator
 
 
 async def async_setup_entry(
@@ -22,26 +24,23 @@ async def async_setup_entry(
 ) -> None:
     """Create diagnostic sensors for zone configuration."""
     hub: AmbientikaHub = hass.data[DOMAIN][entry.entry_id]
+    zones = hub.zone_coordinator
 
     # Add zone configuration sensors for each device
-    diagnostic_sensors = []
-
-    for device in hub.devices:
-        diagnostic_sensors.extend([
-            DeviceRoleSensor(hub, device),
-            DeviceZoneIndexSensor(hub, device),
-            DeviceConfigurationSensor(hub, device),
-            ZoneMasterDeviceNameSensor(hub, device)
-        ])
-
-    # Add zone summary sensors (one per house)
-    houses_processed = set()
-    for device in hub.devices:
-        # Get house information from coordinator data
-        house_id = getattr(device, 'house_id', None)
-        if house_id and house_id not in houses_processed:
-            diagnostic_sensors.append(ZoneConfigurationSummarySensor(hub, house_id))
-            houses_processed.add(house_id)
+    diagnostic_sensors = [
+        sensor_class(zones, device)
+        for device in hub.devices
+        for sensor_class in (
+            DeviceRoleSensor,
+            DeviceZoneIndexSensor,
+            DeviceConfigurationSensor,
+            ZoneMasterDeviceNameSensor,
+        )
+    ]
+
+    # Add zone summary sensors (one per house, in order of appearance)
+    house_ids = dict.fromkeys(filter(None, (getattr(device, 'house_id', None) for device in hub.devices)))
+    diagnostic_sensors.extend(ZoneConfigurationSummarySensor(zones, house_id) for house_id in house_ids)
 
     async_add_entities(diagnostic_sensors)
 
@@ -50,44 +49,64 @@ class DiagnosticSensorBase(CoordinatorEntity, Entity):
     """Base class for diagnostic sensors."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
     _attr_should_poll = False
 
-    def __init__(self, coordinator: AmbientikaHub, device: Device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device: Device) -> None:
         """Initialize the diagnostic sensor."""
         super().__init__(coordinator)
-        self._device = device
         self._serial = device.serial_number
-
-    @property
-    def device_info(self):
-        """Return information to link this entity with the correct device."""
-        return {
+        self._coordinator_device = coordinator.devices_by_serial.get(self._serial)
+        self._device = self._coordinator_device or device
+        self._update_device_fields()
+        # Link this entity with the correct device
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, self._serial)},
-            "name": self._device.name,
-            "manufacturer": "SUEDWIND",
-            "model": "Ambientika",
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
             "serial_number": self._serial,
         }
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Look up our device and rebuild the attributes once per refresh before writing the state."""
+        self._coordinator_device = self.coordinator.devices_by_serial.get(self._serial)
+        if self._coordinator_device is not None:
+            # Follow the live device object, the one from setup stops being updated
+            self._device = self._coordinator_device
+        self._update_device_fields()
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _update_device_fields(self) -> None:
+        """Read and normalize the device fields once per refresh instead of on every state read."""
+        device = self._device
+        self._raw_role = getattr(device, 'role', None)
+        role = self._raw_role or ""
+        self._role = role.lower()
+        self._role_title = role.title()
+        zone_index = getattr(device, 'zone_index', None)
+        self._zone_index = zone_index if zone_index is not None else 0
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes, cached until the next refresh."""
+        return {}
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.data:
-            return False
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                return True
-        return False
+        return bool(self.coordinator.data) and self._coordinator_device is not None
 
 
 class DeviceRoleSensor(DiagnosticSensorBase):
     """Sensor showing the device role (Master/Slave)."""
 
-    _attr_has_entity_name = True
     _attr_name = "Device Role"
     _attr_icon = "mdi:account-supervisor"
 
-    def __init__(self, coordinator: AmbientikaHub, device: Device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device: Device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_device_role"
@@ -95,50 +114,34 @@ class DeviceRoleSensor(DiagnosticSensorBase):
     @property
     def state(self) -> str | None:
         """Return the device role."""
-        try:
-            role = getattr(self._device, 'role', None)
-            if role:
-                # Capitalize and format the role nicely
-                return role.title()
-            return "Unknown"
-        except Exception as e:
-            LOGGER.error(f"Error getting device role for {self._serial}: {e}")
-            return None
+        return self._role_title or "Unknown"
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         return {
             "device_serial": self._serial,
             "device_name": self._device.name,
-            "raw_role": getattr(self._device, 'role', None),
+            "raw_role": self._raw_role,
         }
 
 
 class DeviceZoneIndexSensor(DiagnosticSensorBase):
     """Sensor showing the device zone index."""
 
-    _attr_has_entity_name = True
     _attr_name = "Zone Index"
     _attr_icon = "mdi:home-group"
 
-    def __init__(self, coordinator: AmbientikaHub, device: Device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device: Device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_zone_index"
 
     @property
-    def state(self) -> int | None:
+    def state(self) -> int:
         """Return the zone index."""
-        try:
-            zone_index = getattr(self._device, 'zone_index', None)
-            return zone_index if zone_index is not None else 0
-        except Exception as e:
-            LOGGER.error(f"Error getting zone index for {self._serial}: {e}")
-            return None
+        return self._zone_index
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         return {
             "device_serial": self._serial,
@@ -150,11 +153,10 @@ class DeviceZoneIndexSensor(DiagnosticSensorBase):
 class DeviceConfigurationSensor(DiagnosticSensorBase):
     """Comprehensive sensor showing device configuration details."""
 
-    _attr_has_entity_name = True
     _attr_name = "Configuration"
     _attr_icon = "mdi:cog-outline"
 
-    def __init__(self, coordinator: AmbientikaHub, device: Device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device: Device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_configuration"
@@ -162,36 +164,25 @@ class DeviceConfigurationSensor(DiagnosticSensorBase):
     @property
     def state(self) -> str:
         """Return a summary of the device configuration."""
-        try:
-            role = getattr(self._device, 'role', 'Unknown')
-            zone_index = getattr(self._device, 'zone_index', 0)
-            return f"Zone {zone_index} - {role.title()}"
-        except Exception as e:
-            LOGGER.error(f"Error getting configuration for {self._serial}: {e}")
-            return "Configuration Error"
+        return f"Zone {self._zone_index} - {self._role_title or 'Unknown'}"
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return detailed configuration attributes."""
-        try:
-            return {
-                "device_serial": self._serial,
-                "device_name": self._device.name,
-                "device_id": getattr(self._device, 'id', None),
-                "device_type": getattr(self._device, 'device_type', None),
-                "role": getattr(self._device, 'role', None),
-                "zone_index": getattr(self._device, 'zone_index', None),
-                "room_id": getattr(self._device, 'room_id', None),
-                "user_id": getattr(self._device, 'user_id', None),
-                "installation": getattr(self._device, 'installation', None),
-            }
-        except Exception as e:
-            LOGGER.error(f"Error getting configuration attributes for {self._serial}: {e}")
-            return {}
+        return {
+            "device_serial": self._serial,
+            "device_name": self._device.name,
+            "device_id": getattr(self._device, 'id', None),
+            "device_type": getattr(self._device, 'device_type', None),
+            "role": self._raw_role,
+            "zone_index": self._zone_index,
+            "room_id": getattr(self._device, 'room_id', None),
+            "user_id": getattr(self._device, 'user_id', None),
+            "installation": getattr(self._device, 'installation', None),
+        }
 
 
 class ZoneConfigurationSummarySensor(CoordinatorEntity, Entity):
-    """Sensor providing a summary of all zone configurations."""
+    """Sensor providing a summary of the zone configuration of one house."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_has_entity_name = False
@@ -199,21 +190,32 @@ class ZoneConfigurationSummarySensor(CoordinatorEntity, Entity):
     _attr_icon = "mdi:home-group"
     _attr_should_poll = False
 
-    def __init__(self, coordinator: AmbientikaHub, house_id: int) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, house_id: int) -> None:
         """Initialize the zone summary sensor."""
         super().__init__(coordinator)
         self._house_id = house_id
         self._attr_unique_id = f"ambientika_house_{house_id}_zone_summary"
-
-    @property
-    def device_info(self):
-        """Return house-level device info."""
-        return {
+        # House-level device info
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, f"house_{self._house_id}")},
             "name": f"Ambientika House {self._house_id}",
-            "manufacturer": "SUEDWIND",
+            "manufacturer": MANUFACTURER,
             "model": "Ambientika System",
         }
+        self._set_zones(coordinator.zones_by_house.get(house_id, {}))
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up this house's zones and rebuild the attributes once per refresh before writing the state."""
+        self._set_zones(self.coordinator.zones_by_house.get(self._house_id, {}))
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _set_zones(self, zones: dict[int, dict[str, Any]]) -> None:
+        """Keep this house's zones and count their devices once for the state and attributes."""
+        self._zones = zones
+        self._device_count = sum(len(zone_data['devices']) for zone_data in zones.values())
 
     @property
     def available(self) -> bool:
@@ -226,65 +228,23 @@ class ZoneConfigurationSummarySensor(CoordinatorEntity, Entity):
         if not self.coordinator.data:
             return "No Data"
 
-        try:
-            zones = self._analyze_zones()
-            if not zones:
-                return "No Zones Configured"
-
-            zone_count = len(zones)
-            device_count = sum(len(devices) for devices in zones.values())
-            return f"{zone_count} Zones, {device_count} Devices"
-        except Exception as e:
-            LOGGER.error(f"Error calculating zone summary: {e}")
-            return "Error"
-
-    def _analyze_zones(self) -> dict:
-        """Analyze devices and group by zones."""
-        zones = {}
-
-        for device in self.coordinator.data:
-            try:
-                zone_index = getattr(device, 'zone_index', 0)
-                role = getattr(device, 'role', 'Unknown')
-
-                if zone_index not in zones:
-                    zones[zone_index] = {
-                        'devices': [],
-                        'master': None,
-                        'slaves': []
-                    }
-
-                device_info = {
-                    'name': device.name,
-                    'serial': device.serial_number,
-                    'role': role
-                }
+        zones = self._zones
+        if not zones:
+            return "No Zones Configured"
 
-                zones[zone_index]['devices'].append(device_info)
+        return f"{len(zones)} Zones, {self._device_count} Devices"
 
-                if 'master' in role.lower():
-                    zones[zone_index]['master'] = device_info
-                else:
-                    zones[zone_index]['slaves'].append(device_info)
-
-            except Exception as e:
-                LOGGER.warning(f"Error processing device {device.serial_number}: {e}")
-                continue
-
-        return zones
-
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return detailed zone configuration."""
         if not self.coordinator.data:
             return {}
 
         try:
-            zones = self._analyze_zones()
+            zones = self._zones
 
             attributes = {
                 "zone_count": len(zones),
-                "total_devices": len(self.coordinator.data),
+                "total_devices": self._device_count,
                 "zones": {}
             }
 
@@ -301,18 +261,17 @@ class ZoneConfigurationSummarySensor(CoordinatorEntity, Entity):
             return attributes
 
         except Exception as e:
-            LOGGER.error(f"Error generating zone attributes: {e}")
+            LOGGER.error("Error generating zone attributes: %s", e)
             return {"error": str(e)}
 
 
 class ZoneMasterDeviceNameSensor(DiagnosticSensorBase):
     """Diagnostic sensor for displaying the name of the master device in the zone."""
 
-    _attr_has_entity_name = True
     _attr_name = "Zone Master Device"
     _attr_icon = "mdi:account-supervisor"
 
-    def __init__(self, coordinator: AmbientikaHub, device: Device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device: Device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_zone_master_device_name"
@@ -320,55 +279,29 @@ class ZoneMasterDeviceNameSensor(DiagnosticSensorBase):
     @property
     def state(self) -> str | None:
         """State of the sensor - returns the name of the master device in the same zone."""
-        if not self.coordinator.data:
+        if not self.coordinator.data or self._coordinator_device is None:
             return None
 
-        # Get this device's zone
-        this_device_zone = None
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                this_device_zone = getattr(device, 'zone_index', 0)
-                break
-
-        if this_device_zone is None:
-            return None
-
-        # Find the master device in the same zone
-        for device in self.coordinator.data:
-            device_zone = getattr(device, 'zone_index', 0)
-            device_role = getattr(device, 'role', '').lower()
-
-            if device_zone == this_device_zone and device_role == 'master':
-                return device.name
+        if master := self.coordinator.zone_masters.get(self._zone_index):
+            return master.name
 
         return "No master device found"
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         if not self.coordinator.data:
             return {}
 
-        # Get this device's zone
         this_device_zone = None
         this_device_zone_name = None
         zone_device_count = 0
         master_device_serial = None
 
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                this_device_zone = getattr(device, 'zone_index', 0)
-                break
-
-        if this_device_zone is not None:
-            # Count devices in this zone and find master
-            for device in self.coordinator.data:
-                device_zone = getattr(device, 'zone_index', 0)
-                if device_zone == this_device_zone:
-                    zone_device_count += 1
-                    device_role = getattr(device, 'role', '').lower()
-                    if device_role == 'master':
-                        master_device_serial = device.serial_number
+        if self._coordinator_device is not None:
+            this_device_zone = self._zone_index
+            zone_device_count = len(self.coordinator.devices_by_zone.get(this_device_zone, ()))
+            if master := self.coordinator.zone_masters.get(this_device_zone):
+                master_device_serial = master.serial_number
 
             # Generate zone name
             if this_device_zone == 0:
@@ -381,5 +314,5 @@ class ZoneMasterDeviceNameSensor(DiagnosticSensorBase):
             "zone_name": this_device_zone_name,
             "zone_device_count": zone_device_count,
             "master_device_serial": master_device_serial,
-            "current_device_role": getattr(self._device, 'role', 'unknown').lower(),
+            "current_device_role": self._role or "unknown",
         }
@@ -6,26 +6,22 @@ providing zone information to all entities and enabling zone-based device groupi
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Mapping
-from datetime import timedelta, datetime
-import asyncio
+from datetime import datetime, timedelta
 from typing import Any
 from dataclasses import dataclass
 
-from returns.result import Success, Failure
-
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.update_coordinator import UpdateFailed, DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
-from .api import (
-    AmbientikaApiClient,
-    AmbientikaApiClientAuthenticationError,
-    AmbientikaApiClientError,
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    LOGGER,
+    MASTER_ROLES,
+    SLAVE_ROLES,
 )
-from .const import DOMAIN, LOGGER
+from .hub import AmbientikaHub
 
 
 @dataclass
@@ -56,122 +52,103 @@ class HouseInfo:
     total_devices: int = 0
 
 
-class EnhancedAmbientikaHub(DataUpdateCoordinator):
-    """Enhanced hub with zone management capabilities."""
+class EnhancedAmbientikaHub(AmbientikaHub):
+    """Enhanced hub with zone management capabilities.
 
-    config_entry: ConfigEntry
+    Refreshing, indexing and mode changes are inherited from AmbientikaHub, this
+    class adds the zone bookkeeping on top.
+    """
 
-    def __init__(self, hass: HomeAssistant, config: Mapping[str, Any]) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: Mapping[str, Any],
+        update_interval: timedelta = timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+    ) -> None:
         """Initialize the enhanced hub."""
-        self._hass_config = hass
-        self._hass = hass
-        self._credentials = {
-            "username": config.get(CONF_USERNAME, ""),
-            "password": config.get(CONF_PASSWORD, ""),
-        }
-        self.devices = []
-        self.client = None
-        self._rate_limit_lock = asyncio.Lock()
-        self._last_update_time = 0
-        self._cached_data = None
-        self._min_time_between_updates = 30
+        super().__init__(hass=hass, config=config, update_interval=update_interval)
+        self.last_update_time: datetime | None = None  # Last successful refresh
 
         # Zone management attributes
         self._houses: dict[int, HouseInfo] = {}
         self._device_zones: dict[str, int] = {}  # serial_number -> zone_index
         self._zone_masters: dict[int, str] = {}  # zone_index -> master_serial
-        self._zone_slaves: dict[int, list[str]] = {}  # zone_index -> [slave_serials]
-
-        super().__init__(
-            hass=hass,
-            logger=LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(minutes=5),
-        )
-
-    async def login(self) -> None:
-        """Login and initialize zone data."""
-        self.client = AmbientikaApiClient(
-            username=self._credentials["username"],
-            password=self._credentials["password"],
-        )
-
-        # Fetch initial device data
-        self.devices = await self.client.async_get_data()
+        self._zone_slaves: defaultdict[int, list[str]] = defaultdict(list)  # zone_index -> [slave_serials]
 
-        # Initialize zone information
-        await self._initialize_zone_data()
-
-    async def _initialize_zone_data(self) -> None:
-        """Initialize zone configuration from device data."""
-        LOGGER.debug("Initializing zone data...")
+    async def _update_house_zone_data(self) -> None:
+        """Take over the zone information of houses not seen before.
 
+        The device-level zones are kept current by _index_devices.
+        """
+        known_houses = len(self._houses)
         try:
-            # Get houses with zone information if available
-            if hasattr(self.client, '_api_client') and self.client._api_client:
-                houses_result = await self.client._api_client.houses()
-
-                if isinstance(houses_result, Success):
-                    houses = houses_result.unwrap()
-                    await self._process_house_zone_data(houses)
+            # The houses carry the zone information, if any
+            await self._process_house_zone_data(self.houses_data)
 
         except Exception as e:
-            LOGGER.warning(f"Could not fetch house zone data: {e}")
-
-        # Always process device-level zone information
-        self._process_device_zone_data()
+            LOGGER.warning("Could not process house zone data: %s", e)
 
-        LOGGER.info(f"Zone initialization complete: {len(self._houses)} houses, "
-                   f"{len(self._device_zones)} devices in zones")
+        if len(self._houses) != known_houses:
+            LOGGER.info(
+                "Zone data updated: %s houses, %s devices in zones",
+                len(self._houses),
+                len(self._device_zones),
+            )
 
     async def _process_house_zone_data(self, houses) -> None:
         """Process zone data from house information."""
         for house in houses:
+            if house.id in self._houses:
+                # The house layout only changes on a reload, keep what was already computed
+                continue
             try:
                 house_info = HouseInfo(
                     house_id=house.id,
                     house_name=house.name,
                     zones={},
                     has_zones=getattr(house, 'has_zones', False),
-                    total_devices=len([device for room in house.rooms for device in room.devices])
+                    total_devices=sum(len(room.devices) for room in house.rooms)
                 )
 
                 # Process zone information if available
-                if hasattr(house, 'zones') and house.zones:
-                    LOGGER.debug(f"House {house.name} has zone data: {house.zones}")
+                zones = getattr(house, 'zones', None)
+                if zones:
+                    LOGGER.debug("House %s has zone data: %s", house.name, zones)
                     # Note: The zones structure from API might need additional processing
                     # depending on the actual API response format
 
                 self._houses[house.id] = house_info
 
             except Exception as e:
-                LOGGER.error(f"Error processing house {getattr(house, 'name', 'Unknown')}: {e}")
+                LOGGER.error("Error processing house %s: %s", getattr(house, 'name', 'Unknown'), e)
 
     def _process_device_zone_data(self) -> None:
         """Process zone information from device data."""
+        # Start over so devices that moved or left don't linger in old zones
+        self._device_zones = {}
+        self._zone_masters = {}
+        self._zone_slaves = defaultdict(list)
+
         for device in self.devices:
             try:
                 serial = device.serial_number
                 zone_index = getattr(device, 'zone_index', 0)
                 role = getattr(device, 'role', '').lower()
 
-                # Track device zone assignment
+                # Track device zone assignment, every zone gets a (possibly empty) slave list
                 self._device_zones[serial] = zone_index
-
-                # Initialize zone tracking if needed
-                if zone_index not in self._zone_slaves:
-                    self._zone_slaves[zone_index] = []
+                zone_slaves = self._zone_slaves[zone_index]
 
                 # Assign master/slave roles
-                if role == 'master':
+                if role in MASTER_ROLES:
                     self._zone_masters[zone_index] = serial
-                    LOGGER.debug(f"Device {device.name} ({serial}) is master for zone {zone_index}")
-                elif role in ['slave', 'slaveequalmaster']:
-                    self._zone_slaves[zone_index].append(serial)
-                    LOGGER.debug(f"Device {device.name} ({serial}) is slave in zone {zone_index}")
+                    LOGGER.debug("Device %s (%s) is master for zone %s", device.name, serial, zone_index)
+                elif role in SLAVE_ROLES:
+                    zone_slaves.append(serial)
+                    LOGGER.debug("Device %s (%s) is slave in zone %s", device.name, serial, zone_index)
 
             except Exception as e:
-                LOGGER.error(f"Error processing device zone data for {device.serial_number}: {e}")
+                LOGGER.error("Error processing device zone data for %s: %s", device.serial_number, e)
 
     def get_device_zone(self, serial_number: str) -> int:
         """Get the zone index for a device."""
@@ -185,27 +162,15 @@ class EnhancedAmbientikaHub(DataUpdateCoordinator):
         """Get the slave device serials for a zone."""
         return self._zone_slaves.get(zone_index, [])
 
-    def get_zone_devices(self, zone_index: int) -> list[str]:
-        """Get all device serials in a zone."""
-        devices = []
+    def get_zone_devices(self, zone_index: int) -> tuple[str, ...]:
+        """Get all device serials in a zone, master first."""
         master = self.get_zone_master(zone_index)
-        if master:
-            devices.append(master)
-        devices.extend(self.get_zone_slaves(zone_index))
-        return devices
-
-    def get_device_role_in_zone(self, serial_number: str) -> str:
-        """Get the role of a device in its zone."""
-        zone = self.get_device_zone(serial_number)
-        if self.get_zone_master(zone) == serial_number:
-            return "Master"
-        elif serial_number in self.get_zone_slaves(zone):
-            return "Slave"
-        return "Unknown"
+        return ((master,) if master else ()) + tuple(self.get_zone_slaves(zone_index))
 
     def get_zone_summary(self) -> dict[str, Any]:
         """Get a summary of all zone configurations."""
         zones = {}
+        names = {device.serial_number: device.name for device in self.devices}
 
         # Get all unique zones
         all_zones = set(self._device_zones.values())
@@ -214,26 +179,16 @@ class EnhancedAmbientikaHub(DataUpdateCoordinator):
             master_serial = self.get_zone_master(zone_index)
             slaves = self.get_zone_slaves(zone_index)
 
-            # Get device names
-            master_name = None
-            slave_names = []
-
-            for device in self.devices:
-                if device.serial_number == master_serial:
-                    master_name = device.name
-                elif device.serial_number in slaves:
-                    slave_names.append(device.name)
-
             zones[zone_index] = {
                 "master": {
                     "serial": master_serial,
-                    "name": master_name
+                    "name": names.get(master_serial)
                 } if master_serial else None,
                 "slaves": [
-                    {"serial": serial, "name": name}
-                    for serial, name in zip(slaves, slave_names)
+                    {"serial": serial, "name": names.get(serial)}
+                    for serial in slaves
                 ],
-                "device_count": len(self.get_zone_devices(zone_index))
+                "device_count": (1 if master_serial else 0) + len(slaves)
             }
 
         return {
@@ -250,74 +205,15 @@ class EnhancedAmbientikaHub(DataUpdateCoordinator):
             }
         }
 
-    def invalidate_cache(self) -> None:
-        """Invalidate the cache and zone data."""
-        LOGGER.debug("Cache invalidated - forcing fresh data fetch on next update")
-        self._cached_data = None
-        self._last_update_time = 0
+    async def _async_fetch_data(self):
+        """Fetch the devices like the base hub and remember when that succeeded."""
+        devices = await super()._async_fetch_data()
+        # Every refresh fetches the houses, only new ones have to be processed
+        await self._update_house_zone_data()
+        self.last_update_time = dt_util.now()
+        return devices
 
-    async def _async_update_data(self):
-        """Update data via library with zone information."""
-        try:
-            async with self._rate_limit_lock:
-                current_time = self._hass.loop.time()
-                time_since_last_update = current_time - self._last_update_time
-
-                if self._cached_data is not None and time_since_last_update < self._min_time_between_updates:
-                    LOGGER.debug("Using cached data (%.2f seconds since last update)", time_since_last_update)
-                    return self._cached_data
-
-                LOGGER.debug("HUB: Fetching data from Ambientika API with zone information.")
-                devices = await self.client.async_get_data()
-
-                # Update device status
-                for device in devices:
-                    try:
-                        LOGGER.debug(f"Updating status for device {device.serial_number}")
-                        status = await device.status()
-                        if isinstance(status, Success):
-                            device.current_status = status.unwrap()
-                            # Add zone information to device status
-                            device.zone_info = {
-                                "zone_index": self.get_device_zone(device.serial_number),
-                                "role_in_zone": self.get_device_role_in_zone(device.serial_number),
-                                "zone_master": self.get_zone_master(self.get_device_zone(device.serial_number)),
-                                "zone_devices": self.get_zone_devices(self.get_device_zone(device.serial_number))
-                            }
-                            LOGGER.debug(f"Successfully updated device {device.serial_number} with zone info")
-                        elif isinstance(status, Failure):
-                            LOGGER.warning(f"Failed to get status for device {device.serial_number}: {status.failure()}")
-                    except Exception as e:
-                        LOGGER.error(f"Error updating device {device.serial_number}: {str(e)}")
-                        continue
-
-                # Refresh zone data periodically
-                if current_time - self._last_update_time > 300:  # Refresh zone data every 5 minutes
-                    self._process_device_zone_data()
-
-                LOGGER.debug(f"Update completed for {len(devices)} devices")
-                self._cached_data = devices
-                self._last_update_time = current_time
-                return self._cached_data
-
-        except AmbientikaApiClientAuthenticationError as exception:
-            await self.client.close()
-            self.client = None
-            self._cached_data = None
-            raise ConfigEntryAuthFailed(exception) from exception
-        except AmbientikaApiClientError as exception:
-            self._cached_data = None
-            raise UpdateFailed(exception) from exception
-
-    async def async_unload(self):
-        """Clean up resources when unloading the integration."""
-        if self.client:
-            await self.client.close()
-            self.client = None
-
-    @property
-    def last_update_time(self):
-        """Return the last update time as a datetime object."""
-        if self._last_update_time:
-            return datetime.fromtimestamp(self._last_update_time)
-        return None
+    def _index_devices(self, devices) -> None:
+        """Build the shared lookups and keep the zone tracking in step with the devices it describes."""
+        super()._index_devices(devices)
+        self._process_device_zone_data()
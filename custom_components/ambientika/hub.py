@@ -7,16 +7,19 @@ References:
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Mapping
 from datetime import timedelta
+from operator import attrgetter
 import asyncio
 from typing import Any
 
+from ambientika_py import Device, FanSpeed, HumidityLevel, LightSensorLevel, OperatingMode
 from returns.result import Success, Failure
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 
 from homeassistant.helpers.update_coordinator import UpdateFailed, DataUpdateCoordinator
@@ -27,7 +30,77 @@ from .api import (
     AmbientikaApiClientAuthenticationError,
     AmbientikaApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    IDLE_REFRESHES_BEFORE_SLOWDOWN,
+    LOGGER,
+    MASTER_ROLES,
+    MAX_IDLE_SCAN_INTERVAL,
+    MAX_PARALLEL_STATUS_REQUESTS,
+    MAX_SCAN_INTERVAL,
+    MODE_CHANGE_DEBOUNCE,
+    SLAVE_ROLES,
+    AmbientikaApiClientRateLimitError,
+)
+
+_ZONE_FIELDS = attrgetter(
+    'name', 'serial_number', 'role', 'zone_index', 'room_id', 'device_type', 'installation'
+)
+
+
+def _zone_fields(device) -> tuple:
+    """Return the zone related fields of a device, with defaults for the optional ones."""
+    try:
+        return _ZONE_FIELDS(device)
+    except AttributeError:
+        return (
+            device.name,
+            device.serial_number,
+            getattr(device, 'role', None),
+            getattr(device, 'zone_index', 0),
+            getattr(device, 'room_id', None),
+            getattr(device, 'device_type', 'Unknown'),
+            getattr(device, 'installation', 'Unknown'),
+        )
+
+
+# Status fields reported as plain integers, stored as enum members for the entities
+_STATUS_ENUMS = (
+    ("operating_mode", OperatingMode),
+    ("fan_speed", FanSpeed),
+    ("humidity_level", HumidityLevel),
+    ("light_sensor_level", LightSensorLevel),
+)
+
+
+class DeviceData(tuple):
+    """The devices of one refresh, compared by the fields the entities show.
+
+    Every refresh publishes new device objects, which carry the current API client.
+    Two refreshes reporting the same fields still compare equal, so the coordinator
+    skips the entity updates for them.
+    """
+
+    snapshot: tuple | None
+
+    def __new__(cls, devices, snapshot: tuple | None) -> DeviceData:
+        """Create the device tuple with the snapshot it is compared by."""
+        data = super().__new__(cls, devices)
+        data.snapshot = snapshot
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the snapshots of two refreshes."""
+        if not isinstance(other, DeviceData):
+            return NotImplemented
+        # A cleared snapshot never matches, the next refresh has to be published
+        return self.snapshot is not None and self.snapshot == other.snapshot
+
+    def __ne__(self, other: object) -> bool:
+        """Negate __eq__, tuple would otherwise compare the device objects."""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
 
 
 class AmbientikaHub(DataUpdateCoordinator):
@@ -35,94 +108,419 @@ class AmbientikaHub(DataUpdateCoordinator):
 
     config_entry: ConfigEntry
 
-    def __init__(self, hass: HomeAssistant, config: Mapping[str, Any]) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: Mapping[str, Any],
+        update_interval: timedelta = timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+    ) -> None:
         """Initialize the hub to manage all devices and the API facade."""
-        self._hass_config = hass
-        self._hass = hass
         self._credentials = {
             "username": config.get(CONF_USERNAME, ""),
             "password": config.get(CONF_PASSWORD, ""),
         }
-        self.devices = []
+        self.devices: tuple[Device, ...] = ()  # Devices of the last refresh, used to set up the entities
+        self.devices_by_serial: dict[str, Device] = {}
+        self.status_by_serial: dict[str, dict] = {}  # Last known status of each device
+        self.devices_by_zone: dict[int, list[Device]] = {}
+        self.zone_masters: dict[int, Device] = {}  # zone_index -> master device
+        self.houses_data: tuple = ()  # Houses from the last refresh, fetched together with the devices
+        self.zone_coordinator = None  # Set up after the first refresh
         self.client = None
-        self._rate_limit_lock = asyncio.Lock()
-        self._last_update_time = 0
-        self._cached_data = None
-        self._min_time_between_updates = 30  # Minimum seconds between API calls
+        self._refresh_task: asyncio.Task | None = None
+        self._status_semaphore = asyncio.Semaphore(MAX_PARALLEL_STATUS_REQUESTS)
+        # Debounced mode changes per serial, see async_change_mode
+        self._pending_mode_changes: dict[str, dict] = {}
+        self._mode_change_futures: dict[str, asyncio.Future] = {}
+        self._mode_change_handles: dict[str, asyncio.TimerHandle] = {}
+        self._unchanged_refreshes = 0
 
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=5),
+            update_interval=update_interval,
+            # Only notify entities when the devices actually changed
+            always_update=False,
         )
+        self._base_update_interval = update_interval
 
     async def login(self) -> None:
-        """Async loading of the devices."""
-
+        """Create the API client and authenticate, the devices come with the next refresh."""
         self.client = AmbientikaApiClient(
             username=self._credentials["username"],
             password=self._credentials["password"],
         )
-        self.devices = await self.client.async_get_data()
-
-    def invalidate_cache(self) -> None:
-        """Invalidate the cache to force a fresh data fetch on next update."""
-        LOGGER.debug("Cache invalidated - forcing fresh data fetch on next update")
-        self._cached_data = None
-        self._last_update_time = 0
+        await self.client.async_test_auth()
 
     async def _async_update_data(self):
-        """Update data via library."""
+        """Update data via library.
+
+        Overlapping refreshes (scheduled poll, entity requests) share the one in flight
+        instead of fetching every device status again.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._async_fetch_data())
+
+        return await asyncio.shield(self._refresh_task)
+
+    async def _async_fetch_data(self):
+        """Fetch the devices and their status, and publish them if anything changed."""
         try:
-            # Use a lock to prevent multiple simultaneous updates
-            async with self._rate_limit_lock:
-                current_time = self._hass.loop.time()
-                time_since_last_update = current_time - self._last_update_time
-
-                # If we have cached data and haven't waited long enough, return the cache
-                if self._cached_data is not None and time_since_last_update < self._min_time_between_updates:
-                    LOGGER.debug("Using cached data (%.2f seconds since last update)", time_since_last_update)
-                    return self._cached_data
-
-                # Otherwise, fetch new data
-                LOGGER.debug("HUB: Fetching data from Ambientika API.")
-                devices = await self.client.async_get_data()
-
-                # Update device status for each device
-                device_updates = []
-                for device in devices:
-                    try:
-                        LOGGER.debug(f"Updating status for device {device.serial_number}")
-                        status = await device.status()
-                        if isinstance(status, Success):
-                            # Store the current status in the device object
-                            device.current_status = status.unwrap()
-                            LOGGER.debug(f"Successfully updated device {device.serial_number}")
-                        elif isinstance(status, Failure):
-                            LOGGER.warning(f"Failed to get status for device {device.serial_number}: {status.failure()}")
-                        else:
-                            LOGGER.warning(f"Unexpected status result type for device {device.serial_number}")
-                    except Exception as e:
-                        LOGGER.error(f"Error updating device {device.serial_number}: {str(e)}")
-                        continue
-
-                LOGGER.debug(f"Update completed for {len(devices)} devices")
-                self._cached_data = devices
-                self._last_update_time = current_time
-                return self._cached_data
+            if self.client is None:
+                # Re-create the client dropped after an authentication failure
+                LOGGER.debug("HUB: Client not initialized, logging in again.")
+                await self.login()
+
+            LOGGER.debug("HUB: Fetching data from Ambientika API.")
+            devices = await self.client.async_get_data()
+            self.houses_data = self.client.houses
+
+            # Fetch the status of all devices concurrently
+            results = await asyncio.gather(
+                *(self._async_get_device_status(device) for device in devices),
+                return_exceptions=True,
+            )
+            self._apply_device_status(devices, results)
 
+            LOGGER.debug("Update completed for %s devices", len(devices))
+            # Always publish the new devices, the previous ones may still hold a closed
+            # API client. Data equal to the last refresh does not update the entities.
+            data = DeviceData(devices, self._snapshot_devices(devices))
+            self._index_devices(data)
+            if data == self.data:
+                LOGGER.debug("Device data unchanged since the last update")
+                self._unchanged_refreshes += 1
+            else:
+                self._unchanged_refreshes = 0
+            self._adapt_update_interval()
+            return data
+
+        except AmbientikaApiClientRateLimitError as exception:
+            # Back off exponentially; the interval is restored after the next successful update
+            self.update_interval = min(
+                self.update_interval * 2, timedelta(seconds=MAX_SCAN_INTERVAL)
+            )
+            LOGGER.warning("Rate limited by Ambientika API, update interval raised to %s", self.update_interval)
+            raise UpdateFailed(exception) from exception
         except AmbientikaApiClientAuthenticationError as exception:
-            await self.client.close()  # Clean up the failed client
+            if self.client is not None:
+                await self.client.close()  # Clean up the failed client
             self.client = None  # Force re-auth on next update
-            self._cached_data = None  # Clear cache on auth error
             raise ConfigEntryAuthFailed(exception) from exception
         except AmbientikaApiClientError as exception:
-            self._cached_data = None  # Clear cache on error
             raise UpdateFailed(exception) from exception
 
+    def _adapt_update_interval(self) -> None:
+        """Poll less often while the devices stay unchanged, back to normal on any change.
+
+        This also restores the configured interval after a rate limit backoff.
+        """
+        interval = self._base_update_interval
+        # Ten steps reach the ceiling from any allowed base interval
+        idle_steps = min(self._unchanged_refreshes - IDLE_REFRESHES_BEFORE_SLOWDOWN + 1, 10)
+        if idle_steps > 0:
+            ceiling = max(interval, timedelta(seconds=MAX_IDLE_SCAN_INTERVAL))
+            interval = min(interval * 1.5**idle_steps, ceiling)
+
+        if self.update_interval != interval:
+            LOGGER.debug("Update interval changed from %s to %s", self.update_interval, interval)
+            self.update_interval = interval
+            # Unchanged data does not notify the entities, the management sensor shows the interval
+            self.async_update_listeners()
+
+    @staticmethod
+    def _snapshot_devices(devices) -> tuple:
+        """Return a comparable snapshot of the device fields exposed by entities."""
+        return tuple(
+            (
+                device.serial_number,
+                device.name,
+                getattr(device, 'role', None),
+                getattr(device, 'zone_index', None),
+                getattr(device, 'current_status', None),
+            )
+            for device in devices
+        )
+
+    def _index_devices(self, devices) -> None:
+        """Build the per-serial and per-zone lookups shared by all entities."""
+        by_serial = {}
+        status_by_serial = {}
+        by_zone = {}
+        masters = {}
+        for device in devices:
+            zone_index = getattr(device, 'zone_index', 0)
+            by_serial[device.serial_number] = device
+            # Devices whose status could not be fetched have no current_status at all
+            status_by_serial[device.serial_number] = getattr(device, 'current_status', None)
+            by_zone.setdefault(zone_index, []).append(device)
+            if getattr(device, 'role', '').lower() in MASTER_ROLES:
+                masters.setdefault(zone_index, device)
+        self.devices = devices
+        self.devices_by_serial = by_serial
+        self.status_by_serial = status_by_serial
+        self.devices_by_zone = by_zone
+        self.zone_masters = masters
+
+    async def _async_get_device_status(self, device):
+        """Fetch the current status of a single device, within the parallel request limit."""
+        LOGGER.debug("Updating status for device %s", device.serial_number)
+        async with self._status_semaphore:
+            return await device.status()
+
+    @staticmethod
+    def _apply_device_status(devices, results) -> None:
+        """Store each fetched status on its device object.
+
+        Authentication and rate limit errors concern the whole account and fail the
+        refresh, any other error only affects its own device.
+        """
+        for result in results:
+            if isinstance(result, AmbientikaApiClientAuthenticationError | AmbientikaApiClientRateLimitError):
+                raise result
+            # The patched API reports HTTP errors as a Failure instead of raising
+            if isinstance(result, Failure) and isinstance(failure := result.failure(), dict):
+                if failure.get("status_code") == 401:
+                    raise AmbientikaApiClientAuthenticationError(f"Ambientika API rejected the token: {failure}")
+                if failure.get("status_code") == 429:
+                    raise AmbientikaApiClientRateLimitError(f"Ambientika API rate limit reached: {failure}")
+
+        for device, status in zip(devices, results):
+            if isinstance(status, Success):
+                device.current_status = status.unwrap()
+                for key, enum_cls in _STATUS_ENUMS:
+                    value = device.current_status.get(key)
+                    if isinstance(value, int) and not isinstance(value, enum_cls):
+                        # Unknown values are kept as reported
+                        device.current_status[key] = enum_cls._value2member_map_.get(value, value)
+                LOGGER.debug("Successfully updated device %s", device.serial_number)
+            elif isinstance(status, Failure):
+                LOGGER.warning("Failed to get status for device %s: %s", device.serial_number, status.failure())
+            elif isinstance(status, BaseException):
+                LOGGER.error("Error updating device %s: %s", device.serial_number, status)
+            else:
+                LOGGER.warning("Unexpected status result type for device %s", device.serial_number)
+
+    async def async_refresh_device(self, serial: str) -> None:
+        """Fetch the status of a single device and publish it to the entities.
+
+        Errors concerning the whole account are left to a regular full refresh.
+        """
+        if (device := self.devices_by_serial.get(serial)) is None:
+            return
+
+        results = await asyncio.gather(self._async_get_device_status(device), return_exceptions=True)
+        try:
+            self._apply_device_status((device,), results)
+        except AmbientikaApiClientError:
+            await self.async_request_refresh()
+            return
+
+        self.data.snapshot = self._snapshot_devices(self.data)
+        # Compare with the published status, which may have been set optimistically
+        status = getattr(device, 'current_status', None)
+        if status != self.status_by_serial.get(serial):
+            self.status_by_serial[serial] = status
+            self.async_update_listeners()
+
+    @callback
+    def async_set_device_status(self, device, status: dict) -> None:
+        """Store a status known without asking the API (e.g. right after a change) and publish it."""
+        device.current_status = status
+        self.status_by_serial[device.serial_number] = status
+        # The next refresh has to publish the real status even if it did not change
+        self.data.snapshot = None
+        self.async_set_updated_data(self.data)
+
+    async def async_change_mode(self, device, mode_data: dict, key: str):
+        """Change one mode setting of a device and return the change_mode result.
+
+        mode_data holds all settings required by the API, only key is the requested
+        change. Changes arriving for the same device within MODE_CHANGE_DEBOUNCE are
+        merged and sent as a single change_mode call.
+        """
+        serial = device.serial_number
+        pending = self._pending_mode_changes.setdefault(serial, dict(mode_data))
+        pending[key] = mode_data[key]
+
+        if (future := self._mode_change_futures.get(serial)) is None:
+            future = self._mode_change_futures[serial] = self.hass.loop.create_future()
+        if (handle := self._mode_change_handles.get(serial)) is not None:
+            handle.cancel()
+        self._mode_change_handles[serial] = self.hass.loop.call_later(
+            MODE_CHANGE_DEBOUNCE, self._flush_mode_change, device
+        )
+
+        return await asyncio.shield(future)
+
+    def has_pending_mode_change(self, serial: str) -> bool:
+        """Return whether a mode change for the device is waiting to be sent."""
+        return serial in self._pending_mode_changes
+
+    def _flush_mode_change(self, device) -> None:
+        """Send the merged mode changes of a device once no further change arrived."""
+        serial = device.serial_number
+        del self._mode_change_handles[serial]
+        mode_data = self._pending_mode_changes.pop(serial)
+        future = self._mode_change_futures.pop(serial)
+        self.hass.async_create_task(self._async_send_mode_change(device, mode_data, future))
+
+    @staticmethod
+    async def _async_send_mode_change(device, mode_data: dict, future: asyncio.Future) -> None:
+        """Call change_mode and hand the result to every select waiting for it."""
+        LOGGER.debug("Sending mode_data to API for device %s: %s", device.serial_number, mode_data)
+        try:
+            result = await device.change_mode(mode_data)
+        except Exception as err:
+            if not future.done():
+                future.set_exception(err)
+        else:
+            if not future.done():
+                future.set_result(result)
+
     async def async_unload(self):
         """Clean up resources when unloading the integration."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        for handle in self._mode_change_handles.values():
+            handle.cancel()
+        for future in self._mode_change_futures.values():
+            future.cancel()
+        self._mode_change_handles.clear()
+        self._mode_change_futures.clear()
+        self._pending_mode_changes.clear()
         if self.client:
             await self.client.close()
             self.client = None
+
+
+class AmbientikaZoneCoordinator(DataUpdateCoordinator):
+    """Low-frequency coordinator for the zone topology shown by diagnostic sensors.
+
+    It does not poll the API on its own. The hub hands over each refresh and the
+    diagnostic entities are only updated when device roles or zones change.
+    """
+
+    def __init__(self, hass: HomeAssistant, hub: DataUpdateCoordinator) -> None:
+        """Initialize the zone coordinator from the hub's current data."""
+        super().__init__(
+            hass=hass,
+            logger=LOGGER,
+            name=f"{DOMAIN}_zones",
+            update_interval=None,
+            always_update=False,
+        )
+        self.hub = hub
+        self.devices_by_serial: dict[str, Device] = {}
+        self.devices_by_zone: dict[int, list[Device]] = {}
+        self.zone_masters: dict[int, Device] = {}
+        # house_id -> zone_index -> {'devices', 'master', 'slaves'}, shared by the summary sensors
+        self.zones_by_house: dict[Any, dict[int, dict[str, Any]]] = {}
+        # Zone masters, slaves and rooms across all houses, shown by the zone management sensor
+        self.zone_configuration: dict[str, Any] = {"total_zones": 0, "total_devices": 0, "zones": {}}
+        self._topology = None
+        self.async_handle_hub_update()
+
+    @callback
+    def async_handle_hub_update(self) -> None:
+        """Take over the hub data when the zone topology has changed."""
+        devices = self.hub.data
+        if not devices:
+            return
+
+        topology = tuple(
+            (
+                device.serial_number,
+                device.name,
+                getattr(device, 'role', None),
+                getattr(device, 'zone_index', None),
+                getattr(device, 'house_id', None),
+                getattr(device, 'room_id', None),
+                getattr(device, 'device_type', None),
+                getattr(device, 'installation', None),
+            )
+            for device in devices
+        )
+        if topology == self._topology:
+            return
+
+        LOGGER.debug("Zone topology changed, updating diagnostic sensors")
+        self._topology = topology
+        self.devices_by_serial = self.hub.devices_by_serial
+        self.devices_by_zone = self.hub.devices_by_zone
+        self.zone_masters = self.hub.zone_masters
+        self.zones_by_house = self._summarize_zones(devices)
+        self.zone_configuration = self._analyze_zone_configuration(devices)
+        self.async_set_updated_data(devices)
+
+    @staticmethod
+    def _summarize_zones(devices) -> dict[Any, dict[int, dict[str, Any]]]:
+        """Group the devices of each house by zone, with the zone's master and slaves."""
+        zones_by_house: dict[Any, dict[int, dict[str, Any]]] = {}
+        for device in devices:
+            role = getattr(device, 'role', None) or 'Unknown'
+            device_info = {
+                'name': device.name,
+                'serial': device.serial_number,
+                'role': role
+            }
+
+            zones = zones_by_house.setdefault(getattr(device, 'house_id', None), {})
+            zone = zones.setdefault(
+                getattr(device, 'zone_index', 0), {'devices': [], 'master': None, 'slaves': []}
+            )
+            zone['devices'].append(device_info)
+
+            role_lower = role.lower()
+            if role_lower in MASTER_ROLES:
+                zone['master'] = device_info
+            elif role_lower in SLAVE_ROLES:
+                zone['slaves'].append(device_info)
+
+        return zones_by_house
+
+    @staticmethod
+    def _analyze_zone_configuration(devices) -> dict[str, Any]:
+        """Group all devices by zone, with the zone's master, slaves and rooms."""
+        zones: defaultdict[int, dict[str, Any]] = defaultdict(
+            lambda: {'master': None, 'slaves': [], 'rooms': set(), 'device_count': 0}
+        )
+
+        # Group devices by zone in a single pass
+        for device in devices:
+            name, serial, role, zone_index, room_id, device_type, installation = _zone_fields(device)
+            role = role or 'Unknown'
+            zone = zones[zone_index]
+
+            device_info = {
+                'name': name,
+                'serial': serial,
+                'role': role,
+                'room_id': room_id,
+                'device_type': device_type,
+                'installation': installation
+            }
+
+            zone['device_count'] += 1
+            zone['rooms'].add(room_id)
+
+            role_lower = role.lower()
+            if role_lower in MASTER_ROLES:
+                zone['master'] = device_info
+            elif role_lower in SLAVE_ROLES:
+                zone['slaves'].append(device_info)
+
+        # Convert rooms set to list for JSON serialization
+        for zone in zones.values():
+            zone['rooms'] = list(zone['rooms'])
+
+        return {
+            "total_zones": len(zones),
+            "total_devices": len(devices),
+            "zones": dict(zones)
+        }
+
+    async def _async_update_data(self):
+        """Return the hub's devices when a refresh is requested explicitly."""
+        return self.hub.data
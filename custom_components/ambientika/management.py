@@ -7,15 +7,30 @@ including zone configuration diagnostics and synchronization settings.
 from __future__ import annotations
 
 from typing import Any
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity, EntityCategory
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import SensorEntity
 
-from .const import DOMAIN, LOGGER
-from .hub import AmbientikaHub
+from .const import DOMAIN, LOGGER, MANUFACTURER, MODEL
+from .hub import AmbientikaHub, AmbientikaZoneCoordinator
+
+# Constant part of the management sensor attributes, shared instead of rebuilt on every update
+_SYNC_CONTROLS = {
+    "zones_to_floors_switch": f"switch.{DOMAIN}_sync_zones_to_floors",
+    "rooms_to_areas_switch": f"switch.{DOMAIN}_sync_rooms_to_areas",
+    "description": "Use the toggle switches to control synchronization settings"
+}
+
+# Device info for the integration, shared by the management sensors
+_MANAGEMENT_DEVICE_INFO = {
+    "identifiers": {(DOMAIN, "management")},
+    "name": "Ambientika Management",
+    "manufacturer": MANUFACTURER,
+    "model": "Integration Management",
+}
 
 
 async def async_setup_entry(
@@ -23,6 +38,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Ambientika Management sensors."""
     hub: AmbientikaHub = hass.data[DOMAIN][entry.entry_id]
+    zones = hub.zone_coordinator
 
     # Add management sensors
     management_sensors = [
@@ -31,20 +47,15 @@ async def async_setup_entry(
     ]
 
     # Add diagnostic sensors for each device
-    for device in hub.devices:
-        management_sensors.extend([
-            DeviceRoleSensor(hub, device),
-            DeviceZoneIndexSensor(hub, device),
-            DeviceConfigurationSensor(hub, device)
-        ])
-
-    # Add zone summary sensors (one per house)
-    houses_processed = set()
-    for device in hub.devices:
-        house_id = getattr(device, 'house_id', None)
-        if house_id and house_id not in houses_processed:
-            management_sensors.append(ZoneConfigurationSummarySensor(hub, house_id))
-            houses_processed.add(house_id)
+    management_sensors.extend(
+        sensor_class(zones, device)
+        for device in hub.devices
+        for sensor_class in (DeviceRoleSensor, DeviceZoneIndexSensor, DeviceConfigurationSensor)
+    )
+
+    # Add zone summary sensors (one per house, in order of appearance)
+    house_ids = dict.fromkeys(filter(None, (getattr(device, 'house_id', None) for device in hub.devices)))
+    management_sensors.extend(ZoneConfigurationSummarySensor(zones, house_id) for house_id in house_ids)
 
     async_add_entities(management_sensors)
 
@@ -55,6 +66,7 @@ class AmbientikaManagementSensor(CoordinatorEntity, Entity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_has_entity_name = False
     _attr_name = "Sync Management"
+    _attr_device_info = _MANAGEMENT_DEVICE_INFO
     _attr_icon = "mdi:cog-outline"
     _attr_should_poll = False
 
@@ -63,24 +75,33 @@ class AmbientikaManagementSensor(CoordinatorEntity, Entity):
         super().__init__(coordinator)
         self._config = config
         self._attr_unique_id = f"{DOMAIN}_management"
-
-    @property
-    def device_info(self):
-        """Return device info for the integration."""
-        return {
-            "identifiers": {(DOMAIN, "management")},
-            "name": "Ambientika Management",
-            "manufacturer": "SUEDWIND",
-            "model": "Integration Management",
+        # The config entry data does not change while the entity exists
+        self._configuration = {
+            "auto_sync_enabled": config.get("auto_sync_zones", True),
+            "create_missing_areas": config.get("create_missing_areas", True),
+            "create_missing_floors": config.get("create_missing_floors", True),
         }
+        self._analyzed_data = coordinator.data
+        self._zones = self._analyze_zones()
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Analyze the zones and rebuild the attributes once per refresh before writing the state."""
+        # The hub hands out a new device list whenever something changed
+        data = self.coordinator.data
+        if data is not self._analyzed_data:
+            self._analyzed_data = data
+            self._zones = self._analyze_zones()
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+        super()._handle_coordinator_update()
 
     @property
     def state(self) -> str:
         """Return the state of the management sensor."""
         return "active"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return management configuration attributes."""
         try:
             # Get zone sync settings from config
@@ -88,10 +109,11 @@ class AmbientikaManagementSensor(CoordinatorEntity, Entity):
             sync_rooms_to_areas = self._config.get("sync_rooms_to_areas", True)
 
             # Get device counts
-            device_count = len(self.coordinator.data) if self.coordinator.data else 0
+            data = self.coordinator.data
+            device_count = len(data) if data else 0
 
             # Analyze zones
-            zones_info = self._analyze_zones()
+            zones_info = self._zones
 
             return {
                 "device_count": device_count,
@@ -101,45 +123,28 @@ class AmbientikaManagementSensor(CoordinatorEntity, Entity):
                 "sync_zones_to_floors": sync_zones_to_floors,
                 "sync_rooms_to_areas": sync_rooms_to_areas,
                 "integration_mode": "zone_based" if zones_info.get("has_real_zones") else "room_based",
-                "sync_controls": {
-                    "zones_to_floors_switch": f"switch.{DOMAIN}_sync_zones_to_floors",
-                    "rooms_to_areas_switch": f"switch.{DOMAIN}_sync_rooms_to_areas",
-                    "description": "Use the toggle switches to control synchronization settings"
-                },
-                "configuration": {
-                    "auto_sync_enabled": self._config.get("auto_sync_zones", True),
-                    "create_missing_areas": self._config.get("create_missing_areas", True),
-                    "create_missing_floors": self._config.get("create_missing_floors", True),
-                }
+                "update_interval": self.coordinator.update_interval.total_seconds(),
+                "sync_controls": _SYNC_CONTROLS,
+                "configuration": self._configuration,
             }
 
         except Exception as e:
-            LOGGER.error(f"Error generating management attributes: {e}")
+            LOGGER.error("Error generating management attributes: %s", e)
             return {"error": str(e), "error_type": "attribute_generation_failed"}
 
     def _analyze_zones(self) -> dict[str, Any]:
         """Analyze zone configuration."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return {"zone_count": 0, "room_count": 0, "has_real_zones": False}
 
-        zones = set()
-        rooms = set()
-        has_real_zones = False
-
-        for device in self.coordinator.data:
-            try:
-                zone_index = getattr(device, 'zone_index', 0)
-                room_id = getattr(device, 'room_id', None)
-
-                zones.add(zone_index)
-                if room_id:
-                    rooms.add(room_id)
-
-                if zone_index != 0:
-                    has_real_zones = True
-
-            except Exception as e:
-                LOGGER.warning(f"Error analyzing device {device.serial_number}: {e}")
+        zones = self.coordinator.devices_by_zone
+        rooms = {
+            room_id
+            for device in data
+            if (room_id := getattr(device, 'room_id', None))
+        }
+        has_real_zones = any(zone_index != 0 for zone_index in zones)
 
         return {
             "zone_count": len(zones),
@@ -152,44 +157,64 @@ class DiagnosticSensorBase(CoordinatorEntity, Entity):
     """Base class for diagnostic sensors."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
     _attr_should_poll = False
 
-    def __init__(self, coordinator: AmbientikaHub, device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device) -> None:
         """Initialize the diagnostic sensor."""
         super().__init__(coordinator)
-        self._device = device
         self._serial = device.serial_number
-
-    @property
-    def device_info(self):
-        """Return information to link this entity with the correct device."""
-        return {
+        self._coordinator_device = coordinator.devices_by_serial.get(self._serial)
+        self._device = self._coordinator_device or device
+        self._update_device_fields()
+        # Link this entity with the correct device
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, self._serial)},
-            "name": self._device.name,
-            "manufacturer": "SUEDWIND",
-            "model": "Ambientika",
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
             "serial_number": self._serial,
         }
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Look up our device and rebuild the attributes once per refresh before writing the state."""
+        self._coordinator_device = self.coordinator.devices_by_serial.get(self._serial)
+        if self._coordinator_device is not None:
+            # Follow the live device object, the one from setup stops being updated
+            self._device = self._coordinator_device
+        self._update_device_fields()
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _update_device_fields(self) -> None:
+        """Read and normalize the device fields once per refresh instead of on every state read."""
+        device = self._device
+        self._raw_role = getattr(device, 'role', None)
+        role = self._raw_role or ""
+        self._role = role.lower()
+        self._role_title = role.title()
+        zone_index = getattr(device, 'zone_index', None)
+        self._zone_index = zone_index if zone_index is not None else 0
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes, cached until the next refresh."""
+        return {}
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.data:
-            return False
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                return True
-        return False
+        return bool(self.coordinator.data) and self._coordinator_device is not None
 
 
 class DeviceRoleSensor(DiagnosticSensorBase):
     """Sensor showing the device role (Master/Slave)."""
 
-    _attr_has_entity_name = True
     _attr_name = "Device Role"
     _attr_icon = "mdi:account-supervisor"
 
-    def __init__(self, coordinator: AmbientikaHub, device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_device_role"
@@ -197,49 +222,34 @@ class DeviceRoleSensor(DiagnosticSensorBase):
     @property
     def state(self) -> str | None:
         """Return the device role."""
-        try:
-            role = getattr(self._device, 'role', None)
-            if role:
-                return role.title()
-            return "Unknown"
-        except Exception as e:
-            LOGGER.error(f"Error getting device role for {self._serial}: {e}")
-            return None
+        return self._role_title or "Unknown"
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         return {
             "device_serial": self._serial,
             "device_name": self._device.name,
-            "raw_role": getattr(self._device, 'role', None),
+            "raw_role": self._raw_role,
         }
 
 
 class DeviceZoneIndexSensor(DiagnosticSensorBase):
     """Sensor showing the device zone index."""
 
-    _attr_has_entity_name = True
     _attr_name = "Zone Index"
     _attr_icon = "mdi:home-group"
 
-    def __init__(self, coordinator: AmbientikaHub, device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_zone_index"
 
     @property
-    def state(self) -> int | None:
+    def state(self) -> int:
         """Return the zone index."""
-        try:
-            zone_index = getattr(self._device, 'zone_index', None)
-            return zone_index if zone_index is not None else 0
-        except Exception as e:
-            LOGGER.error(f"Error getting zone index for {self._serial}: {e}")
-            return None
+        return self._zone_index
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         return {
             "device_serial": self._serial,
@@ -251,11 +261,10 @@ class DeviceZoneIndexSensor(DiagnosticSensorBase):
 class DeviceConfigurationSensor(DiagnosticSensorBase):
     """Comprehensive sensor showing device configuration details."""
 
-    _attr_has_entity_name = True
     _attr_name = "Configuration"
     _attr_icon = "mdi:cog-outline"
 
-    def __init__(self, coordinator: AmbientikaHub, device) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, device) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, device)
         self._attr_unique_id = f"{self._serial}_configuration"
@@ -263,36 +272,25 @@ class DeviceConfigurationSensor(DiagnosticSensorBase):
     @property
     def state(self) -> str:
         """Return a summary of the device configuration."""
-        try:
-            role = getattr(self._device, 'role', 'Unknown')
-            zone_index = getattr(self._device, 'zone_index', 0)
-            return f"Zone {zone_index} - {role.title()}"
-        except Exception as e:
-            LOGGER.error(f"Error getting configuration for {self._serial}: {e}")
-            return "Configuration Error"
+        return f"Zone {self._zone_index} - {self._role_title or 'Unknown'}"
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return detailed configuration attributes."""
-        try:
-            return {
-                "device_serial": self._serial,
-                "device_name": self._device.name,
-                "device_id": getattr(self._device, 'id', None),
-                "device_type": getattr(self._device, 'device_type', None),
-                "role": getattr(self._device, 'role', None),
-                "zone_index": getattr(self._device, 'zone_index', None),
-                "room_id": getattr(self._device, 'room_id', None),
-                "user_id": getattr(self._device, 'user_id', None),
-                "installation": getattr(self._device, 'installation', None),
-            }
-        except Exception as e:
-            LOGGER.error(f"Error getting configuration attributes for {self._serial}: {e}")
-            return {}
+        return {
+            "device_serial": self._serial,
+            "device_name": self._device.name,
+            "device_id": getattr(self._device, 'id', None),
+            "device_type": getattr(self._device, 'device_type', None),
+            "role": self._raw_role,
+            "zone_index": self._zone_index,
+            "room_id": getattr(self._device, 'room_id', None),
+            "user_id": getattr(self._device, 'user_id', None),
+            "installation": getattr(self._device, 'installation', None),
+        }
 
 
 class ZoneConfigurationSummarySensor(CoordinatorEntity, Entity):
-    """Sensor providing a summary of all zone configurations."""
+    """Sensor providing a summary of the zone configuration of one house."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_has_entity_name = False
@@ -300,21 +298,32 @@ class ZoneConfigurationSummarySensor(CoordinatorEntity, Entity):
     _attr_icon = "mdi:home-group"
     _attr_should_poll = False
 
-    def __init__(self, coordinator: AmbientikaHub, house_id: int) -> None:
+    def __init__(self, coordinator: AmbientikaZoneCoordinator, house_id: int) -> None:
         """Initialize the zone summary sensor."""
         super().__init__(coordinator)
         self._house_id = house_id
         self._attr_unique_id = f"ambientika_house_{house_id}_zone_summary"
-
-    @property
-    def device_info(self):
-        """Return house-level device info."""
-        return {
+        # House-level device info
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, f"house_{self._house_id}")},
             "name": f"Ambientika House {self._house_id}",
-            "manufacturer": "SUEDWIND",
+            "manufacturer": MANUFACTURER,
             "model": "Ambientika System",
         }
+        self._set_zones(coordinator.zones_by_house.get(house_id, {}))
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up this house's zones and rebuild the attributes once per refresh before writing the state."""
+        self._set_zones(self.coordinator.zones_by_house.get(self._house_id, {}))
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _set_zones(self, zones: dict[int, dict[str, Any]]) -> None:
+        """Keep this house's zones and count their devices once for the state and attributes."""
+        self._zones = zones
+        self._device_count = sum(len(zone_data['devices']) for zone_data in zones.values())
 
     @property
     def available(self) -> bool:
@@ -327,65 +336,23 @@ class ZoneConfigurationSummarySensor(CoordinatorEntity, Entity):
         if not self.coordinator.data:
             return "No Data"
 
-        try:
-            zones = self._analyze_zones()
-            if not zones:
-                return "No Zones Configured"
-
-            zone_count = len(zones)
-            device_count = sum(len(devices) for devices in zones.values())
-            return f"{zone_count} Zones, {device_count} Devices"
-        except Exception as e:
-            LOGGER.error(f"Error calculating zone summary: {e}")
-            return "Error"
-
-    def _analyze_zones(self) -> dict:
-        """Analyze devices and group by zones."""
-        zones = {}
-
-        for device in self.coordinator.data:
-            try:
-                zone_index = getattr(device, 'zone_index', 0)
-                role = getattr(device, 'role', 'Unknown')
-
-                if zone_index not in zones:
-                    zones[zone_index] = {
-                        'devices': [],
-                        'master': None,
-                        'slaves': []
-                    }
-
-                device_info = {
-                    'name': device.name,
-                    'serial': device.serial_number,
-                    'role': role
-                }
-
-                zones[zone_index]['devices'].append(device_info)
-
-                if role.lower() == 'master':
-                    zones[zone_index]['master'] = device_info
-                elif role.lower() in ['slaveoppositemaster', 'slaveequalmaster']:
-                    zones[zone_index]['slaves'].append(device_info)
-
-            except Exception as e:
-                LOGGER.warning(f"Error processing device {device.serial_number}: {e}")
-                continue
+        zones = self._zones
+        if not zones:
+            return "No Zones Configured"
 
-        return zones
+        return f"{len(zones)} Zones, {self._device_count} Devices"
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return detailed zone configuration."""
         if not self.coordinator.data:
             return {}
 
         try:
-            zones = self._analyze_zones()
+            zones = self._zones
 
             attributes = {
                 "zone_count": len(zones),
-                "total_devices": len(self.coordinator.data),
+                "total_devices": self._device_count,
                 "zones": {}
             }
 
@@ -402,7 +369,7 @@ class ZoneConfigurationSummarySensor(CoordinatorEntity, Entity):
             return attributes
 
         except Exception as e:
-            LOGGER.error(f"Error generating zone attributes: {e}")
+            LOGGER.error("Error generating zone attributes: %s", e)
             return {"error": str(e)}
 
 
@@ -412,6 +379,7 @@ class ZoneManagementSensor(CoordinatorEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_has_entity_name = False
     _attr_name = "Zone Management"
+    _attr_device_info = _MANAGEMENT_DEVICE_INFO
     _attr_icon = "mdi:home-group-plus"
     _attr_should_poll = False
 
@@ -420,17 +388,24 @@ class ZoneManagementSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._config = config
         self._attr_unique_id = f"{DOMAIN}_zone_management"
-        self._zone_data = None
-
-    @property
-    def device_info(self):
-        """Return device info for the integration."""
-        return {
-            "identifiers": {(DOMAIN, "management")},
-            "name": "Ambientika Management",
-            "manufacturer": "SUEDWIND",
-            "model": "Integration Management",
-        }
+        self._analyzed_data = coordinator.data
+        self._zone_config = coordinator.zone_coordinator.zone_configuration
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the attributes when the hub published new devices.
+
+        The zone analysis itself is done by the zone coordinator, only when the topology changes.
+        A failed refresh also notifies the entities but keeps the previous device list,
+        only the availability has to be written then.
+        """
+        data = self.coordinator.data
+        if data is not self._analyzed_data:
+            self._analyzed_data = data
+            self._zone_config = self.coordinator.zone_coordinator.zone_configuration
+            self._attr_extra_state_attributes = self._build_extra_state_attributes()
+        super()._handle_coordinator_update()
 
     @property
     def state(self) -> str:
@@ -438,110 +413,34 @@ class ZoneManagementSensor(CoordinatorEntity, SensorEntity):
         if not self.coordinator.data:
             return "No Connection"
 
-        try:
-            zone_info = self._analyze_zone_configuration()
-            return f"Active - {zone_info['total_zones']} Zones"
-        except Exception as e:
-            LOGGER.error(f"Error in zone management state: {e}")
-            return "Error"
-
-    async def async_update_zone_data(self) -> None:
-        """Fetch detailed zone data from the API."""
-        try:
-            # Use the existing client from the hub
-            if hasattr(self.coordinator, 'client') and self.coordinator.client:
-                api_client = self.coordinator.client._api_client
-                if api_client:
-                    # Fetch houses with complete zone information
-                    houses_result = await api_client.houses()
-                    if houses_result:
-                        self._zone_data = houses_result.unwrap() if hasattr(houses_result, 'unwrap') else houses_result
-                        LOGGER.debug(f"Fetched zone data: {len(self._zone_data) if self._zone_data else 0} houses")
-        except Exception as e:
-            LOGGER.error(f"Error fetching zone data: {e}")
-            self._zone_data = None
-
-    def _analyze_zone_configuration(self) -> dict[str, Any]:
-        """Analyze the current zone configuration."""
-        if not self.coordinator.data:
-            return {"total_zones": 0, "total_devices": 0, "zones": {}}
-
-        zones = {}
-        device_count = 0
-
-        # Group devices by zone
-        for device in self.coordinator.data:
-            try:
-                zone_index = getattr(device, 'zone_index', 0)
-                role = getattr(device, 'role', 'Unknown')
-                room_id = getattr(device, 'room_id', None)
-
-                if zone_index not in zones:
-                    zones[zone_index] = {
-                        'master': None,
-                        'slaves': [],
-                        'rooms': set(),
-                        'device_count': 0
-                    }
-
-                device_info = {
-                    'name': device.name,
-                    'serial': device.serial_number,
-                    'role': role,
-                    'room_id': room_id,
-                    'device_type': getattr(device, 'device_type', 'Unknown'),
-                    'installation': getattr(device, 'installation', 'Unknown')
-                }
-
-                zones[zone_index]['device_count'] += 1
-                zones[zone_index]['rooms'].add(room_id)
-                device_count += 1
-
-                if role.lower() == 'master':
-                    zones[zone_index]['master'] = device_info
-                elif role.lower() in ['slave', 'slaveequalmaster']:
-                    zones[zone_index]['slaves'].append(device_info)
-
-            except Exception as e:
-                LOGGER.warning(f"Error processing device {device.serial_number}: {e}")
-                continue
-
-        # Convert rooms set to list for JSON serialization
-        for zone in zones.values():
-            zone['rooms'] = list(zone['rooms'])
-
-        return {
-            "total_zones": len(zones),
-            "total_devices": device_count,
-            "zones": zones
-        }
+        return f"Active - {self._zone_config['total_zones']} Zones"
 
     def _get_house_zone_info(self) -> dict[str, Any]:
         """Get zone information from house data if available."""
-        if not self._zone_data:
+        if not self.coordinator.houses_data:
             return {}
 
         house_zones = {}
         try:
-            for house in self._zone_data:
-                if hasattr(house, 'zones') and house.zones:
+            for house in self.coordinator.houses_data:
+                zones = getattr(house, 'zones', None)
+                if zones:
                     house_zones[house.name] = {
                         'house_id': house.id,
                         'has_zones': getattr(house, 'has_zones', False),
-                        'zones': house.zones,
+                        'zones': zones,
                         'address': getattr(house, 'address', ''),
                         'room_count': len(getattr(house, 'rooms', []))
                     }
         except Exception as e:
-            LOGGER.error(f"Error processing house zone info: {e}")
+            LOGGER.error("Error processing house zone info: %s", e)
 
         return house_zones
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return comprehensive zone management attributes."""
         try:
-            zone_config = self._analyze_zone_configuration()
+            zone_config = self._zone_config
             house_zones = self._get_house_zone_info()
 
             # Build master-slave relationships
@@ -568,6 +467,7 @@ class ZoneManagementSensor(CoordinatorEntity, SensorEntity):
                 elif len(zone_data.get('slaves', [])) == 0:
                     recommendations.append(f"Zone {zone_id}: No slave devices - check if zone configuration is complete")
 
+            data = self.coordinator.data
             return {
                 "configuration_summary": zone_config,
                 "house_zone_info": house_zones,
@@ -576,23 +476,12 @@ class ZoneManagementSensor(CoordinatorEntity, SensorEntity):
                 "recommendations": recommendations,
                 "last_updated": self.coordinator.last_update_time.isoformat() if self.coordinator.last_update_time else None,
                 "api_integration": {
-                    "total_api_devices": len(self.coordinator.data) if self.coordinator.data else 0,
-                    "connection_status": "Connected" if self.coordinator.data else "Disconnected",
+                    "total_api_devices": len(data) if data else 0,
+                    "connection_status": "Connected" if data else "Disconnected",
                     "data_source": "Ambientika Cloud API"
                 }
             }
 
         except Exception as e:
-            LOGGER.error(f"Error generating zone management attributes: {e}")
+            LOGGER.error("Error generating zone management attributes: %s", e)
             return {"error": str(e), "error_type": "attribute_generation_failed"}
-
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        # Fetch initial zone data
-        await self.async_update_zone_data()
-
-    async def async_update(self) -> None:
-        """Update the zone management data."""
-        await self.async_update_zone_data()
-        await super().async_update()
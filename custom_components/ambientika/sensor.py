@@ -9,15 +9,17 @@ References:
 
 from __future__ import annotations
 
+from enum import Enum
+
 from ambientika_py import DeviceStatus, LightSensorLevel, FanSpeed, OperatingMode, HumidityLevel
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.sensor.const import SensorDeviceClass
 
-from .const import DOMAIN, LOGGER, AirQuality, FilterStatus
+from .const import DOMAIN, LOGGER, MANUFACTURER, MASTER_ROLES, MODEL, AirQuality, FilterStatus
 from .hub import AmbientikaHub
 
 # Import management sensors
@@ -36,6 +38,22 @@ except ImportError:
     ZONE_SYNC_AVAILABLE = False
     LOGGER.warning("Zone synchronization not available")
 
+# Reverse lookups from the values reported in the device status to the state names
+_LIGHT_BY_VALUE = {level.value: level.name for level in LightSensorLevel}
+_FAN_BY_VALUE = {speed.value: speed.name for speed in FanSpeed}
+_MODE_BY_VALUE = {mode.value: mode.name for mode in OperatingMode}
+_HUMIDITY_BY_VALUE = {level.value: level.name for level in HumidityLevel}
+# The API reports the air quality and filter status by member name
+_AIR_QUALITY_BY_NAME = AirQuality.__members__
+_FILTER_STATUS_BY_NAME = FilterStatus.__members__
+
+# Options of the enum sensors, the same for every device
+_FILTER_OPTIONS = tuple(FilterStatus.__members__)
+_LIGHT_OPTIONS = tuple(level.name for level in LightSensorLevel if level != LightSensorLevel.NotAvailable)
+_FAN_OPTIONS = tuple(speed.name for speed in FanSpeed)
+_MODE_OPTIONS = tuple(mode.name for mode in OperatingMode)
+_HUMIDITY_OPTIONS = tuple(level.name for level in HumidityLevel)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -43,57 +61,26 @@ async def async_setup_entry(
     """Create the `sensor` entities for each device."""
     hub: AmbientikaHub = hass.data[DOMAIN][entry.entry_id]
 
-    # Add all sensor entities for each device
-    async_add_entities(
-        [
-            TemperatureSensor(hub, device)
-            for device in hub.devices
-        ]
-    )
-    async_add_entities(
-        [
-            HumiditySensor(hub, device)
-            for device in hub.devices
-        ]
-    )
-    async_add_entities(
-        [
-            AirQualitySensor(hub, device)
-            for device in hub.devices
-        ]
-    )
-    async_add_entities(
-        [
-            FilterStatusSensor(hub, device)
-            for device in hub.devices
-        ]
-    )
-    # Add select state monitoring sensors
-    async_add_entities(
-        [
-            LightSensorLevelStateSensor(hub, device)
-            for device in hub.devices
-        ]
-    )
-    async_add_entities(
-        [
-            FanSpeedStateSensor(hub, device)
-            for device in hub.devices
-        ]
-    )
-    async_add_entities(
-        [
-            OperatingModeStateSensor(hub, device)
-            for device in hub.devices
-        ]
-    )
-    # Add humidity level state sensor
-    async_add_entities(
-        [
-            HumidityLevelStateSensor(hub, device)
-            for device in hub.devices
-        ]
-    )
+    # Add all sensor entities for each device, including the select state monitoring sensors
+    entities: list[Entity] = [
+        sensor_cls(hub, device)
+        for device in hub.devices
+        for sensor_cls in (
+            TemperatureSensor,
+            HumiditySensor,
+            AirQualitySensor,
+            FilterStatusSensor,
+            LightSensorLevelStateSensor,
+            FanSpeedStateSensor,
+            OperatingModeStateSensor,
+            HumidityLevelStateSensor,
+        )
+    ]
+
+    def collect_entities(new_entities, update_before_add: bool = False) -> None:
+        """Collect the management and diagnostic sensors, all sensors are added at once below."""
+        entities.extend(new_entities)
+
     # NOTE: Alarm sensors are implemented as binary_sensors in binary_sensor.py
     # They should not be duplicated here as regular sensors
 
@@ -101,9 +88,9 @@ async def async_setup_entry(
     if MANAGEMENT_SENSORS_AVAILABLE:
         try:
             LOGGER.debug("Setting up management sensors")
-            await setup_management_sensors(hass, entry, async_add_entities)
+            await setup_management_sensors(hass, entry, collect_entities)
         except Exception as e:
-            LOGGER.error(f"Failed to setup management sensors: {e}")
+            LOGGER.error("Failed to setup management sensors: %s", e)
     else:
         LOGGER.info("Management sensors not available")
 
@@ -111,9 +98,11 @@ async def async_setup_entry(
     try:
         from .diagnostic_sensor import async_setup_entry as setup_diagnostic_sensors
         LOGGER.debug("Setting up diagnostic sensors")
-        await setup_diagnostic_sensors(hass, entry, async_add_entities)
+        await setup_diagnostic_sensors(hass, entry, collect_entities)
     except Exception as e:
-        LOGGER.error(f"Failed to setup diagnostic sensors: {e}")
+        LOGGER.error("Failed to setup diagnostic sensors: %s", e)
+
+    async_add_entities(entities)
 
     # Add zone synchronization
     if ZONE_SYNC_AVAILABLE:
@@ -124,11 +113,9 @@ async def async_setup_entry(
             await zone_sync.async_initialize()
 
             # Store zone sync manager for use by other components
-            if not hasattr(hass.data[DOMAIN], 'zone_sync'):
-                hass.data[DOMAIN]['zone_sync'] = {}
-            hass.data[DOMAIN]['zone_sync'][entry.entry_id] = zone_sync
+            hass.data[DOMAIN].setdefault('zone_sync', {})[entry.entry_id] = zone_sync
         except Exception as e:
-            LOGGER.error(f"Failed to setup zone synchronization: {e}")
+            LOGGER.error("Failed to setup zone synchronization: %s", e)
     else:
         LOGGER.info("Zone synchronization not available")
 
@@ -143,41 +130,47 @@ class SensorBase(CoordinatorEntity, Entity):
         super().__init__(coordinator)
         self._device = device
         self._serial = device.serial_number
-
-    @property
-    def device_info(self):
-        """Return information to link this entity with the correct device."""
-        return {
+        self._coordinator_device = coordinator.devices_by_serial.get(self._serial)
+        # Every sensor's unique id suffix is its translation key
+        self._attr_unique_id = f"{self._serial}_{self._attr_translation_key}"
+        # Link this entity with the correct device
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, self._serial)},
-            "name": self._device.name,
-            "manufacturer": "SUEDWIND",
-            "model": "Ambientika",
+            "name": device.name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
             "serial_number": self._serial,
         }
+        self._refresh_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Look up our device and compute the state once per refresh before writing it."""
+        self._coordinator_device = self.coordinator.devices_by_serial.get(self._serial)
+        self._refresh_state()
+        super()._handle_coordinator_update()
+
+    def _refresh_state(self) -> None:
+        """Cache availability and state, Home Assistant reads them on every state write."""
+        self._attr_available = bool(self.coordinator.data) and self._coordinator_device is not None
+        self._attr_state = self._compute_state()
+
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
+        return None
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        if not self.coordinator.data:
-            return False
-        # Find our device in the coordinator's data
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                return True
-        return False
+        """Return the availability cached at the last coordinator update."""
+        return self._attr_available
 
     @property
     def device_status(self) -> DeviceStatus | None:
         """Get the current device status from coordinator data."""
         if not self.coordinator.data:
             return None
-
-        # Find our device in the coordinator's current data
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                # Get the current status without making an API call
-                return device.current_status if hasattr(device, 'current_status') else None
-        return None
+        # Get the current status without making an API call
+        return self.coordinator.status_by_serial.get(self._serial)
 
 
 class TemperatureSensor(SensorBase):
@@ -188,14 +181,8 @@ class TemperatureSensor(SensorBase):
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_unit_of_measurement = "°C"
 
-    def __init__(self, coordinator, device):
-        """Initialize the sensor."""
-        super().__init__(coordinator, device)
-        self._attr_unique_id = f"{self._serial}_temperature"
-
-    @property
-    def state(self):
-        """State of the sensor."""
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
         if status := self.device_status:
             try:
                 return float(status.get("temperature", 0))
@@ -216,14 +203,8 @@ class HumiditySensor(SensorBase):
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_unit_of_measurement = "%"
 
-    def __init__(self, coordinator, device):
-        """Initialize the sensor."""
-        super().__init__(coordinator, device)
-        self._attr_unique_id = f"{self._serial}_humidity"
-
-    @property
-    def state(self):
-        """State of the sensor."""
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
         if status := self.device_status:
             try:
                 return int(status.get("humidity", 0))
@@ -243,18 +224,10 @@ class AirQualitySensor(SensorBase):
     _attr_translation_key = "air_quality"
     _attr_icon = "mdi:air-purifier"
 
-    def __init__(self, coordinator, device):
-        """Initialize the sensor."""
-        super().__init__(coordinator, device)
-        self._attr_unique_id = f"{self._serial}_air_quality"
-
-    @property
-    def state(self):
-        """State of the sensor."""
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
         if status := self.device_status:
-            air_quality = status.get("air_quality")
-            if air_quality and air_quality in AirQuality.__members__:
-                return AirQuality[air_quality]
+            return _AIR_QUALITY_BY_NAME.get(status.get("air_quality"))
 
 
 class FilterStatusSensor(SensorBase):
@@ -264,27 +237,68 @@ class FilterStatusSensor(SensorBase):
     _attr_translation_key = "filter_status"
     _attr_icon = "mdi:air-filter"
     _attr_device_class = SensorDeviceClass.ENUM
+    options = _FILTER_OPTIONS
 
-    def __init__(self, coordinator, device):
-        """Initialize the sensor."""
-        super().__init__(coordinator, device)
-        self._attr_unique_id = f"{self._serial}_filter_status"
-
-    @property
-    def state(self):
-        """State of the sensor."""
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
         if status := self.device_status:
-            filter_status = status.get("filters_status")
-            if filter_status and filter_status in FilterStatus.__members__:
-                return FilterStatus[filter_status]
+            return _FILTER_STATUS_BY_NAME.get(status.get("filters_status"))
+
+
+class ZoneAwareSensorBase(SensorBase):
+    """Base for state sensors that show the zone master's settings on other devices."""
+
+    def _get_master_device_status(self):
+        """Get the master device status from the same zone."""
+        if not self.coordinator.data or self._coordinator_device is None:
+            return None
+
+        zone_index = getattr(self._coordinator_device, 'zone_index', 0)
+        if (master := self.coordinator.zone_masters.get(zone_index)) is None:
+            return None
+        return self.coordinator.status_by_serial.get(master.serial_number)
+
+    def _is_master_device(self):
+        """Check if this device is a master device."""
+        if not self.coordinator.data or self._coordinator_device is None:
+            return False
+        return getattr(self._coordinator_device, 'role', '').lower() in MASTER_ROLES
 
     @property
-    def options(self):
-        """Return the list of available options."""
-        return [name for name, _ in FilterStatus.__members__.items()]
+    def extra_state_attributes(self) -> dict:
+        """Return additional state attributes."""
+        if not self.coordinator.data:
+            return {}
+
+        attributes = {}
+
+        # Add information about whether this shows master or own values
+        if self._is_master_device():
+            attributes["source"] = "own_device"
+            attributes["device_role"] = "master"
+        else:
+            attributes["source"] = "master_device"
+            attributes["device_role"] = getattr(self._device, 'role', 'unknown').lower()
+
+            # Find master device info
+            this_device_zone = None
+            master_device_name = None
+            master_device_serial = None
 
+            if self._coordinator_device is not None:
+                this_device_zone = getattr(self._coordinator_device, 'zone_index', 0)
+                if master := self.coordinator.zone_masters.get(this_device_zone):
+                    master_device_name = master.name
+                    master_device_serial = master.serial_number
+
+            attributes["master_device_name"] = master_device_name
+            attributes["master_device_serial"] = master_device_serial
+            attributes["zone_index"] = this_device_zone
+
+        return attributes
 
-class LightSensorLevelStateSensor(SensorBase):
+
+class LightSensorLevelStateSensor(ZoneAwareSensorBase):
     """Sensor for monitoring the current light sensor level state.
     
     ZONE-AWARE MASTER DATA CONSUMPTION:
@@ -303,51 +317,10 @@ class LightSensorLevelStateSensor(SensorBase):
     _attr_translation_key = "light_sensor_level_state"
     _attr_icon = "mdi:lightbulb-on-outline"
     _attr_device_class = SensorDeviceClass.ENUM
+    options = _LIGHT_OPTIONS
 
-    def __init__(self, coordinator, device):
-        """Initialize the sensor."""
-        super().__init__(coordinator, device)
-        self._attr_unique_id = f"{self._serial}_light_sensor_level_state"
-
-    def _get_master_device_status(self):
-        """Get the master device status from the same zone."""
-        if not self.coordinator.data:
-            return None
-
-        # Find this device's zone
-        this_device_zone = None
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                this_device_zone = getattr(device, 'zone_index', 0)
-                break
-
-        if this_device_zone is None:
-            return None
-
-        # Find the master device in the same zone
-        for device in self.coordinator.data:
-            device_zone = getattr(device, 'zone_index', 0)
-            device_role = getattr(device, 'role', '').lower()
-
-            if device_zone == this_device_zone and device_role == 'master':
-                return device.current_status if hasattr(device, 'current_status') else None
-
-        return None
-
-    def _is_master_device(self):
-        """Check if this device is a master device."""
-        if not self.coordinator.data:
-            return False
-
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                device_role = getattr(device, 'role', '').lower()
-                return device_role == 'master'
-        return False
-
-    @property
-    def state(self):
-        """State of the sensor."""
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
         # For master devices, show their own state
         if self._is_master_device():
             status = self.device_status
@@ -359,10 +332,11 @@ class LightSensorLevelStateSensor(SensorBase):
             try:
                 light_sensor_value = status.get("light_sensor_level")
                 if light_sensor_value is not None:
-                    # Convert numeric value to LightSensorLevel enum
-                    for level in LightSensorLevel:
-                        if level.value == light_sensor_value:
-                            return level.name
+                    # Convert value to the LightSensorLevel name
+                    if isinstance(light_sensor_value, Enum):
+                        return light_sensor_value.name
+                    if (name := _LIGHT_BY_VALUE.get(light_sensor_value)) is not None:
+                        return name
                     # If we can't match the value, return the raw value
                     return str(light_sensor_value)
             except (ValueError, TypeError) as e:
@@ -374,55 +348,8 @@ class LightSensorLevelStateSensor(SensorBase):
                 )
         return None
 
-    @property
-    def options(self):
-        """Return the list of available options."""
-        return [level.name for level in LightSensorLevel if level != LightSensorLevel.NotAvailable]
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        attributes = {}
-
-        # Add information about whether this shows master or own values
-        if self._is_master_device():
-            attributes["source"] = "own_device"
-            attributes["device_role"] = "master"
-        else:
-            attributes["source"] = "master_device"
-            attributes["device_role"] = getattr(self._device, 'role', 'unknown').lower()
-
-            # Find master device info
-            this_device_zone = None
-            master_device_name = None
-            master_device_serial = None
-
-            for device in self.coordinator.data:
-                if device.serial_number == self._serial:
-                    this_device_zone = getattr(device, 'zone_index', 0)
-                    break
-
-            if this_device_zone is not None:
-                for device in self.coordinator.data:
-                    device_zone = getattr(device, 'zone_index', 0)
-                    device_role = getattr(device, 'role', '').lower()
-
-                    if device_zone == this_device_zone and device_role == 'master':
-                        master_device_name = device.name
-                        master_device_serial = device.serial_number
-                        break
-
-            attributes["master_device_name"] = master_device_name
-            attributes["master_device_serial"] = master_device_serial
-            attributes["zone_index"] = this_device_zone
-
-        return attributes
-
-
-class FanSpeedStateSensor(SensorBase):
+class FanSpeedStateSensor(ZoneAwareSensorBase):
     """Sensor for monitoring the current fan speed state.
     
     ZONE-AWARE MASTER DATA CONSUMPTION:
@@ -434,51 +361,10 @@ class FanSpeedStateSensor(SensorBase):
     _attr_translation_key = "fan_speed_state"
     _attr_icon = "mdi:fan-alert"
     _attr_device_class = SensorDeviceClass.ENUM
+    options = _FAN_OPTIONS
 
-    def __init__(self, coordinator, device):
-        """Initialize the sensor."""
-        super().__init__(coordinator, device)
-        self._attr_unique_id = f"{self._serial}_fan_speed_state"
-
-    def _get_master_device_status(self):
-        """Get the master device status from the same zone."""
-        if not self.coordinator.data:
-            return None
-
-        # Find this device's zone
-        this_device_zone = None
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                this_device_zone = getattr(device, 'zone_index', 0)
-                break
-
-        if this_device_zone is None:
-            return None
-
-        # Find the master device in the same zone
-        for device in self.coordinator.data:
-            device_zone = getattr(device, 'zone_index', 0)
-            device_role = getattr(device, 'role', '').lower()
-
-            if device_zone == this_device_zone and device_role == 'master':
-                return device.current_status if hasattr(device, 'current_status') else None
-
-        return None
-
-    def _is_master_device(self):
-        """Check if this device is a master device."""
-        if not self.coordinator.data:
-            return False
-
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                device_role = getattr(device, 'role', '').lower()
-                return device_role == 'master'
-        return False
-
-    @property
-    def state(self):
-        """State of the sensor."""
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
         # For master devices, show their own state
         if self._is_master_device():
             status = self.device_status
@@ -490,10 +376,11 @@ class FanSpeedStateSensor(SensorBase):
             try:
                 fan_speed_value = status.get("fan_speed")
                 if fan_speed_value is not None:
-                    # Convert value to FanSpeed enum
-                    for speed in FanSpeed:
-                        if speed.value == fan_speed_value or speed == fan_speed_value:
-                            return speed.name
+                    # Convert value to the FanSpeed name
+                    if isinstance(fan_speed_value, Enum):
+                        return fan_speed_value.name
+                    if (name := _FAN_BY_VALUE.get(fan_speed_value)) is not None:
+                        return name
                     # If we can't match the value, return the raw value
                     return str(fan_speed_value)
             except (ValueError, TypeError) as e:
@@ -505,55 +392,8 @@ class FanSpeedStateSensor(SensorBase):
                 )
         return None
 
-    @property
-    def options(self):
-        """Return the list of available options."""
-        return [speed.name for speed in FanSpeed]
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        attributes = {}
-
-        # Add information about whether this shows master or own values
-        if self._is_master_device():
-            attributes["source"] = "own_device"
-            attributes["device_role"] = "master"
-        else:
-            attributes["source"] = "master_device"
-            attributes["device_role"] = getattr(self._device, 'role', 'unknown').lower()
 
-            # Find master device info
-            this_device_zone = None
-            master_device_name = None
-            master_device_serial = None
-
-            for device in self.coordinator.data:
-                if device.serial_number == self._serial:
-                    this_device_zone = getattr(device, 'zone_index', 0)
-                    break
-
-            if this_device_zone is not None:
-                for device in self.coordinator.data:
-                    device_zone = getattr(device, 'zone_index', 0)
-                    device_role = getattr(device, 'role', '').lower()
-
-                    if device_zone == this_device_zone and device_role == 'master':
-                        master_device_name = device.name
-                        master_device_serial = device.serial_number
-                        break
-
-            attributes["master_device_name"] = master_device_name
-            attributes["master_device_serial"] = master_device_serial
-            attributes["zone_index"] = this_device_zone
-
-        return attributes
-
-
-class OperatingModeStateSensor(SensorBase):
+class OperatingModeStateSensor(ZoneAwareSensorBase):
     """Sensor for monitoring the current operating mode state.
     
     ZONE-AWARE MASTER DATA CONSUMPTION:
@@ -565,51 +405,10 @@ class OperatingModeStateSensor(SensorBase):
     _attr_translation_key = "operating_mode_state"
     _attr_icon = "mdi:cog-outline"
     _attr_device_class = SensorDeviceClass.ENUM
+    options = _MODE_OPTIONS
 
-    def __init__(self, coordinator, device):
-        """Initialize the sensor."""
-        super().__init__(coordinator, device)
-        self._attr_unique_id = f"{self._serial}_operating_mode_state"
-
-    def _get_master_device_status(self):
-        """Get the master device status from the same zone."""
-        if not self.coordinator.data:
-            return None
-
-        # Find this device's zone
-        this_device_zone = None
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                this_device_zone = getattr(device, 'zone_index', 0)
-                break
-
-        if this_device_zone is None:
-            return None
-
-        # Find the master device in the same zone
-        for device in self.coordinator.data:
-            device_zone = getattr(device, 'zone_index', 0)
-            device_role = getattr(device, 'role', '').lower()
-
-            if device_zone == this_device_zone and device_role == 'master':
-                return device.current_status if hasattr(device, 'current_status') else None
-
-        return None
-
-    def _is_master_device(self):
-        """Check if this device is a master device."""
-        if not self.coordinator.data:
-            return False
-
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                device_role = getattr(device, 'role', '').lower()
-                return device_role == 'master'
-        return False
-
-    @property
-    def state(self):
-        """State of the sensor."""
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
         # For master devices, show their own state
         if self._is_master_device():
             status = self.device_status
@@ -621,10 +420,11 @@ class OperatingModeStateSensor(SensorBase):
             try:
                 operating_mode_value = status.get("operating_mode")
                 if operating_mode_value is not None:
-                    # Convert value to OperatingMode enum
-                    for mode in OperatingMode:
-                        if mode.value == operating_mode_value or mode == operating_mode_value:
-                            return mode.name
+                    # Convert value to the OperatingMode name
+                    if isinstance(operating_mode_value, Enum):
+                        return operating_mode_value.name
+                    if (name := _MODE_BY_VALUE.get(operating_mode_value)) is not None:
+                        return name
                     # If we can't match the value, return the raw value
                     return str(operating_mode_value)
             except (ValueError, TypeError) as e:
@@ -636,55 +436,8 @@ class OperatingModeStateSensor(SensorBase):
                 )
         return None
 
-    @property
-    def options(self):
-        """Return the list of available options."""
-        return [mode.name for mode in OperatingMode]
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        attributes = {}
-
-        # Add information about whether this shows master or own values
-        if self._is_master_device():
-            attributes["source"] = "own_device"
-            attributes["device_role"] = "master"
-        else:
-            attributes["source"] = "master_device"
-            attributes["device_role"] = getattr(self._device, 'role', 'unknown').lower()
-
-            # Find master device info
-            this_device_zone = None
-            master_device_name = None
-            master_device_serial = None
-
-            for device in self.coordinator.data:
-                if device.serial_number == self._serial:
-                    this_device_zone = getattr(device, 'zone_index', 0)
-                    break
-
-            if this_device_zone is not None:
-                for device in self.coordinator.data:
-                    device_zone = getattr(device, 'zone_index', 0)
-                    device_role = getattr(device, 'role', '').lower()
-
-                    if device_zone == this_device_zone and device_role == 'master':
-                        master_device_name = device.name
-                        master_device_serial = device.serial_number
-                        break
-
-            attributes["master_device_name"] = master_device_name
-            attributes["master_device_serial"] = master_device_serial
-            attributes["zone_index"] = this_device_zone
-
-        return attributes
-
 
-class HumidityLevelStateSensor(SensorBase):
+class HumidityLevelStateSensor(ZoneAwareSensorBase):
     """Sensor for monitoring the current humidity level state.
     
     ZONE-AWARE MASTER DATA CONSUMPTION:
@@ -696,51 +449,10 @@ class HumidityLevelStateSensor(SensorBase):
     _attr_translation_key = "humidity_level_state"
     _attr_icon = "mdi:water-percent-alert"
     _attr_device_class = SensorDeviceClass.ENUM
+    options = _HUMIDITY_OPTIONS
 
-    def __init__(self, coordinator, device):
-        """Initialize the sensor."""
-        super().__init__(coordinator, device)
-        self._attr_unique_id = f"{self._serial}_humidity_level_state"
-
-    def _get_master_device_status(self):
-        """Get the master device status from the same zone."""
-        if not self.coordinator.data:
-            return None
-
-        # Find this device's zone
-        this_device_zone = None
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                this_device_zone = getattr(device, 'zone_index', 0)
-                break
-
-        if this_device_zone is None:
-            return None
-
-        # Find the master device in the same zone
-        for device in self.coordinator.data:
-            device_zone = getattr(device, 'zone_index', 0)
-            device_role = getattr(device, 'role', '').lower()
-
-            if device_zone == this_device_zone and device_role == 'master':
-                return device.current_status if hasattr(device, 'current_status') else None
-
-        return None
-
-    def _is_master_device(self):
-        """Check if this device is a master device."""
-        if not self.coordinator.data:
-            return False
-
-        for device in self.coordinator.data:
-            if device.serial_number == self._serial:
-                device_role = getattr(device, 'role', '').lower()
-                return device_role == 'master'
-        return False
-
-    @property
-    def state(self):
-        """State of the sensor."""
+    def _compute_state(self):
+        """Return the state of the sensor for the current coordinator data."""
         # For master devices, show their own state
         if self._is_master_device():
             status = self.device_status
@@ -752,10 +464,11 @@ class HumidityLevelStateSensor(SensorBase):
             try:
                 humidity_level_value = status.get("humidity_level")
                 if humidity_level_value is not None:
-                    # Convert value to HumidityLevel enum
-                    for level in HumidityLevel:
-                        if level.value == humidity_level_value or level == humidity_level_value:
-                            return level.name
+                    # Convert value to the HumidityLevel name
+                    if isinstance(humidity_level_value, Enum):
+                        return humidity_level_value.name
+                    if (name := _HUMIDITY_BY_VALUE.get(humidity_level_value)) is not None:
+                        return name
                     # If we can't match the value, return the raw value
                     return str(humidity_level_value)
             except (ValueError, TypeError) as e:
@@ -766,52 +479,3 @@ class HumidityLevelStateSensor(SensorBase):
                     str(e),
                 )
         return None
-
-    @property
-    def options(self):
-        """Return the list of available options."""
-        return [level.name for level in HumidityLevel]
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        attributes = {}
-
-        # Add information about whether this shows master or own values
-        if self._is_master_device():
-            attributes["source"] = "own_device"
-            attributes["device_role"] = "master"
-        else:
-            attributes["source"] = "master_device"
-            attributes["device_role"] = getattr(self._device, 'role', 'unknown').lower()
-
-            # Find master device info
-            this_device_zone = None
-            master_device_name = None
-            master_device_serial = None
-
-            for device in self.coordinator.data:
-                if device.serial_number == self._serial:
-                    this_device_zone = getattr(device, 'zone_index', 0)
-                    break
-
-            if this_device_zone is not None:
-                for device in self.coordinator.data:
-                    device_zone = getattr(device, 'zone_index', 0)
-                    device_role = getattr(device, 'role', '').lower()
-
-                    if device_zone == this_device_zone and device_role == 'master':
-                        master_device_name = device.name
-                        master_device_serial = device.serial_number
-                        break
-
-            attributes["master_device_name"] = master_device_name
-            attributes["master_device_serial"] = master_device_serial
-            attributes["zone_index"] = this_device_zone
-
-        return attributes
-
-
@@ -13,7 +13,7 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, MANUFACTURER
 from .hub import AmbientikaHub
 
 
@@ -37,6 +37,13 @@ class AmbientikaManagementSwitchBase(CoordinatorEntity, SwitchEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
     _attr_should_poll = False
+    # All management entities share the integration's management device
+    _attr_device_info = {
+        "identifiers": {(DOMAIN, "management")},
+        "name": "Ambientika Management",
+        "manufacturer": MANUFACTURER,
+        "model": "Integration Management",
+    }
 
     def __init__(self, coordinator: AmbientikaHub, entry: ConfigEntry, setting_key: str) -> None:
         """Initialize the management switch."""
@@ -44,16 +51,6 @@ class AmbientikaManagementSwitchBase(CoordinatorEntity, SwitchEntity):
         self._entry = entry
         self._setting_key = setting_key
 
-    @property
-    def device_info(self):
-        """Return device info for the integration."""
-        return {
-            "identifiers": {(DOMAIN, "management")},
-            "name": "Ambientika Management",
-            "manufacturer": "SUEDWIND",
-            "model": "Integration Management",
-        }
-
     @property
     def is_on(self) -> bool:
         """Return if the switch is on."""
@@ -88,10 +85,10 @@ class AmbientikaManagementSwitchBase(CoordinatorEntity, SwitchEntity):
             # Update the coordinator state
             self.async_write_ha_state()
 
-            LOGGER.info(f"Updated {self._setting_key} to {value}")
+            LOGGER.info("Updated %s to %s", self._setting_key, value)
 
         except Exception as e:
-            LOGGER.error(f"Error updating {self._setting_key}: {e}")
+            LOGGER.error("Error updating %s: %s", self._setting_key, e)
 
 
 class SyncZonesToFloorsSwitch(AmbientikaManagementSwitchBase):
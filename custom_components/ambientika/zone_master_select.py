@@ -51,6 +51,8 @@ References:
 from __future__ import annotations
 
 import asyncio
+import json
+import logging
 from typing import Any
 from dataclasses import dataclass
 
@@ -64,7 +66,7 @@ from homeassistant.helpers.entity import EntityCategory
 from ambientika_py import OperatingMode
 from returns.result import Success
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, MANUFACTURER, MASTER_ROLES, SLAVE_ROLES
 from .hub import AmbientikaHub
 
 
@@ -140,7 +142,7 @@ async def async_setup_entry(
         entities.append(GlobalMasterDeviceSelect(hub, entry.data))
     else:
         # Create master select for each zone
-        LOGGER.info(f"Creating zone master selects for {len(zone_info_list)} zones")
+        LOGGER.info("Creating zone master selects for %s zones", len(zone_info_list))
         for zone_info in zone_info_list:
             entities.append(ZoneMasterDeviceSelect(hub, entry.data, zone_info))
 
@@ -171,7 +173,7 @@ class ZoneMasterAnalyzer:
                     # Check if house has zones defined in the zone_data
                     zones = house_data.get('zones', [])
                     if zones:
-                        LOGGER.debug(f"House {house_name} has {len(zones)} defined zones")
+                        LOGGER.debug("House %s has %s defined zones", house_name, len(zones))
 
                         # For each zone, collect device zone indices
                         for zone in zones:
@@ -185,11 +187,11 @@ class ZoneMasterAnalyzer:
                                     if zone_index is not None:
                                         legitimate_zones.add(zone_index)
                                         device_name = device.get('name', 'Unknown')
-                                        LOGGER.debug(f"Added zone {zone_index} ('{zone_name}') as legitimate from device {device_name}")
+                                        LOGGER.debug("Added zone %s ('%s') as legitimate from device %s", zone_index, zone_name, device_name)
 
                     # If no zones are defined but rooms exist, include all device zones
                     elif house_data.get('rooms'):
-                        LOGGER.debug(f"House {house_name} has no defined zones, including all device zones")
+                        LOGGER.debug("House %s has no defined zones, including all device zones", house_name)
                         for room in house_data.get('rooms', []):
                             devices = room.get('devices', [])
                             for device in devices:
@@ -197,27 +199,27 @@ class ZoneMasterAnalyzer:
                                 if zone_index is not None:
                                     legitimate_zones.add(zone_index)
                                     device_name = device.get('name', 'Unknown')
-                                    LOGGER.debug(f"Added zone {zone_index} as legitimate (no house zones defined) from device {device_name}")
+                                    LOGGER.debug("Added zone %s as legitimate (no house zones defined) from device %s", zone_index, device_name)
             else:
                 # Fallback: use the coordinator data if zone_data is not available
                 LOGGER.debug("No zone_data available, using coordinator device data")
                 for device in self.coordinator.data:
                     zone_index = getattr(device, 'zone_index', 0)
                     legitimate_zones.add(zone_index)
-                    LOGGER.debug(f"Added zone {zone_index} as legitimate from device {device.name}")
+                    LOGGER.debug("Added zone %s as legitimate from device %s", zone_index, device.name)
 
         except Exception as e:
-            LOGGER.warning(f"Could not determine legitimate zones from house configuration: {e}")
+            LOGGER.warning("Could not determine legitimate zones from house configuration: %s", e)
             # Final fallback: if we can't determine from API, include all zones with devices
             all_device_zones = set()
             for device in self.coordinator.data:
                 zone_index = getattr(device, 'zone_index', 0)
                 all_device_zones.add(zone_index)
 
-            LOGGER.debug(f"Fallback: including all device zones: {all_device_zones}")
+            LOGGER.debug("Fallback: including all device zones: %s", all_device_zones)
             return all_device_zones
 
-        LOGGER.info(f"Identified {len(legitimate_zones)} legitimate zones: {sorted(legitimate_zones)}")
+        LOGGER.info("Identified %s legitimate zones: %s", len(legitimate_zones), sorted(legitimate_zones))
         return legitimate_zones
 
     async def _get_zone_name(self, zone_index: int) -> str | None:
@@ -236,11 +238,11 @@ class ZoneMasterAnalyzer:
                             devices = room.get('devices', [])
                             for device in devices:
                                 if device.get('zoneIndex') == zone_index:
-                                    LOGGER.debug(f"Found zone name '{zone_name}' for zone index {zone_index}")
+                                    LOGGER.debug("Found zone name '%s' for zone index %s", zone_name, zone_index)
                                     return zone_name
 
         except Exception as e:
-            LOGGER.debug(f"Could not get zone name for zone {zone_index}: {e}")
+            LOGGER.debug("Could not get zone name for zone %s: %s", zone_index, e)
 
         return None
 
@@ -252,7 +254,7 @@ class ZoneMasterAnalyzer:
 
         # Get legitimate zones from house configuration
         legitimate_zones = await self._get_legitimate_zones()
-        LOGGER.debug(f"Legitimate zones identified: {legitimate_zones}")
+        LOGGER.debug("Legitimate zones identified: %s", legitimate_zones)
 
         # Group devices by zone
         zones: dict[int, dict[str, Any]] = {}
@@ -264,13 +266,9 @@ class ZoneMasterAnalyzer:
                 serial = device.serial_number
                 name = device.name
 
-                if zone_index not in zones:
-                    zones[zone_index] = {
-                        'devices': [],
-                        'master': None,
-                        'slaves': [],
-                        'zone_rooms': set()
-                    }
+                zone = zones.setdefault(
+                    zone_index, {'devices': [], 'master': None, 'slaves': [], 'zone_rooms': set()}
+                )
 
                 device_info = {
                     'serial': serial,
@@ -279,21 +277,21 @@ class ZoneMasterAnalyzer:
                     'device_obj': device
                 }
 
-                zones[zone_index]['devices'].append(device_info)
+                zone['devices'].append(device_info)
 
                 # Track master device
-                if role == 'master':
-                    zones[zone_index]['master'] = device_info
-                elif role in ['slave', 'slaveequalmaster']:
-                    zones[zone_index]['slaves'].append(device_info)
+                if role in MASTER_ROLES:
+                    zone['master'] = device_info
+                elif role in SLAVE_ROLES:
+                    zone['slaves'].append(device_info)
 
                 # Track rooms in this zone
                 room_id = getattr(device, 'room_id', None)
                 if room_id:
-                    zones[zone_index]['zone_rooms'].add(room_id)
+                    zone['zone_rooms'].add(room_id)
 
             except Exception as e:
-                LOGGER.error(f"Error analyzing device {device.serial_number}: {e}")
+                LOGGER.error("Error analyzing device %s: %s", device.serial_number, e)
                 continue
 
         # Convert to ZoneMasterInfo objects
@@ -302,7 +300,7 @@ class ZoneMasterAnalyzer:
         for zone_index, zone_data in zones.items():
             # Only include zones that are legitimate (from house configuration) or have devices
             if zone_index not in legitimate_zones and len(zones) > 1:
-                LOGGER.debug(f"Skipping zone {zone_index} - not found in legitimate zones: {legitimate_zones}")
+                LOGGER.debug("Skipping zone %s - not found in legitimate zones: %s", zone_index, legitimate_zones)
                 continue
 
             devices = zone_data['devices']
@@ -347,7 +345,7 @@ class ZoneMasterAnalyzer:
         # Sort by zone index
         zone_info_list.sort(key=lambda x: x.zone_index)
 
-        LOGGER.debug(f"Analyzed {len(zone_info_list)} zones for master device configuration")
+        LOGGER.debug("Analyzed %s zones for master device configuration", len(zone_info_list))
         return zone_info_list
 
 
@@ -357,6 +355,12 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_should_poll = False
     _attr_icon = "mdi:account-supervisor-circle"
+    _attr_device_info = {
+        "identifiers": {(DOMAIN, "management")},
+        "name": "Ambientika Management",
+        "manufacturer": MANUFACTURER,
+        "model": "Zone Master Management",
+    }
 
     def __init__(self, coordinator: AmbientikaHub, config: dict[str, Any]):
         """Initialize the base select entity."""
@@ -365,16 +369,6 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
         self._last_update_attempt = 0
         self._update_in_progress = False
 
-    @property
-    def device_info(self):
-        """Return device info for the management component."""
-        return {
-            "identifiers": {(DOMAIN, "management")},
-            "name": "Ambientika Management",
-            "manufacturer": "SUEDWIND",
-            "model": "Zone Master Management",
-        }
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -404,9 +398,9 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                 LOGGER.error("Could not determine original role of new master device")
                 return False
 
-            LOGGER.info(f"Attempting master change from {old_master_device.name} to {new_master_device.name}")
-            LOGGER.info(f"Original role of new master device: {new_master_original_role}")
-            LOGGER.info(f"Role swap strategy: {new_master_device.name} will become Master, {old_master_device.name} will assume role '{new_master_original_role.title()}'")
+            LOGGER.info("Attempting master change from %s to %s", old_master_device.name, new_master_device.name)
+            LOGGER.info("Original role of new master device: %s", new_master_original_role)
+            LOGGER.info("Role swap strategy: %s will become Master, %s will assume role '%s'", new_master_device.name, old_master_device.name, new_master_original_role.title())
 
             # Use the correct API endpoint: /Device/apply-config
             # This is the official method for applying role configuration to house devices
@@ -429,7 +423,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                 return False
 
         except Exception as e:
-            LOGGER.error(f"Exception during master change: {e}")
+            LOGGER.error("Exception during master change: %s", e)
             return False
 
     async def _apply_house_device_configuration(self, old_master_device, new_master_device, new_master_original_role: str) -> bool:
@@ -490,28 +484,28 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                 return default
 
             target_house_id = get_value(target_house, 'id', 'Unknown')
-            LOGGER.debug(f"Applying configuration to house ID: {target_house_id}")
-            LOGGER.debug(f"New master: {new_master_device.name} ({new_master_device.serial_number})")
-            LOGGER.debug(f"Former master: {old_master_device.name} ({old_master_device.serial_number}) -> role: {new_master_original_role}")
+            LOGGER.debug("Applying configuration to house ID: %s", target_house_id)
+            LOGGER.debug("New master: %s (%s)", new_master_device.name, new_master_device.serial_number)
+            LOGGER.debug("Former master: %s (%s) -> role: %s", old_master_device.name, old_master_device.serial_number, new_master_original_role)
 
-            # Debug: Log the exact payload we're sending
-            import json
-            try:
-                LOGGER.debug(f"Sending house configuration payload: {json.dumps(updated_house, indent=2, default=str)}")
-            except Exception as e:
-                LOGGER.debug(f"Could not serialize payload for logging: {e}")
-                LOGGER.debug(f"Payload type: {type(updated_house)}, keys: {list(updated_house.keys()) if isinstance(updated_house, dict) else 'not a dict'}")
+            # Debug: Log the exact payload we're sending, serializing it only when debug logging is on
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                try:
+                    LOGGER.debug("Sending house configuration payload: %s", json.dumps(updated_house, indent=2, default=str))
+                except Exception as e:
+                    LOGGER.debug("Could not serialize payload for logging: %s", e)
+                    LOGGER.debug("Payload type: %s, keys: %s", type(updated_house), list(updated_house.keys()) if isinstance(updated_house, dict) else 'not a dict')
 
             # Apply the configuration using the correct API endpoint
             # POST /Device/apply-config with House object
-            LOGGER.debug(f"Making API call: POST Device/apply-config")
+            LOGGER.debug("Making API call: POST Device/apply-config")
             result = await api_client._api.post("Device/apply-config", updated_house)
 
-            LOGGER.debug(f"API call result type: {type(result)}")
+            LOGGER.debug("API call result type: %s", type(result))
             if isinstance(result, Success):
                 response_data = result.unwrap()
-                LOGGER.info(f"Successfully applied house device configuration. API response: {response_data}")
-                LOGGER.debug(f"API response details: {response_data}")
+                LOGGER.info("Successfully applied house device configuration. API response: %s", response_data)
+                LOGGER.debug("API response details: %s", response_data)
 
                 # Try alternative approaches if house config didn't work
                 LOGGER.warning("API returned success but roles may not have changed. Attempting alternative approaches...")
@@ -523,12 +517,12 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                     LOGGER.warning("Alternative role update methods also failed")
                     return True  # Return true for house config success but log the concern
             else:
-                LOGGER.error(f"Failed to apply house device configuration: {result}")
-                LOGGER.debug(f"Failure details: {result}")
+                LOGGER.error("Failed to apply house device configuration: %s", result)
+                LOGGER.debug("Failure details: %s", result)
                 return False
 
         except Exception as e:
-            LOGGER.error(f"Exception in house device configuration: {e}")
+            LOGGER.error("Exception in house device configuration: %s", e)
             return False
 
     async def _find_target_house(self, houses, old_master_device, new_master_device):
@@ -558,7 +552,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
             if old_master_room_id in room_ids_in_house or new_master_room_id in room_ids_in_house:
                 house_name = get_value(house, 'name', 'Unknown')
                 house_id = get_value(house, 'id', 'Unknown')
-                LOGGER.debug(f"Found target house: {house_name} (ID: {house_id})")
+                LOGGER.debug("Found target house: %s (ID: %s)", house_name, house_id)
                 return house
 
         return None
@@ -612,13 +606,13 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
 
             # Add zones if they exist - CRITICAL ZONE ROLE CONSISTENCY FIX
             zones = get_value(house, 'zones')
-            LOGGER.debug(f"Zone role consistency: Processing zones (found {len(zones) if zones else 0} zones)")
-            LOGGER.debug(f"Zone role consistency: Target serials - new_master: {new_master_serial}, old_master: {old_master_serial}")
+            LOGGER.debug("Zone role consistency: Processing zones (found %s zones)", len(zones) if zones else 0)
+            LOGGER.debug("Zone role consistency: Target serials - new_master: %s, old_master: %s", new_master_serial, old_master_serial)
             if zones:
                 house_config["zones"] = []
                 for zone in zones:
                     zone_name = get_value(zone, 'name')
-                    LOGGER.debug(f"Zone role consistency: Processing zone '{zone_name}'")
+                    LOGGER.debug("Zone role consistency: Processing zone '%s'", zone_name)
                     zone_config = {
                         "id": get_value(zone, 'id'),
                         "name": zone_name,
@@ -626,7 +620,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                     }
                     zone_rooms = get_value(zone, 'rooms')
                     if zone_rooms:
-                        LOGGER.debug(f"Zone role consistency: Zone '{zone_name}' has {len(zone_rooms)} rooms")
+                        LOGGER.debug("Zone role consistency: Zone '%s' has %s rooms", zone_name, len(zone_rooms))
                         # ZONE ROLE CONSISTENCY: Update device roles in zones to match the role changes
                         # This prevents API payload inconsistencies where zones array contradicts rooms array
                         updated_zone_rooms = []
@@ -634,7 +628,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                             updated_room = dict(zone_room)  # Copy room data
                             room_devices = get_value(zone_room, 'devices', [])
                             room_name = get_value(zone_room, 'name')
-                            LOGGER.debug(f"Zone role consistency: Room '{room_name}' has {len(room_devices)} devices")
+                            LOGGER.debug("Zone role consistency: Room '%s' has %s devices", room_name, len(room_devices))
                             if room_devices:
                                 updated_devices = []
                                 for zone_device in room_devices:
@@ -642,22 +636,22 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                                     device_serial = get_value(zone_device, 'serialNumber')
                                     device_name = get_value(zone_device, 'name')
                                     current_role = get_value(zone_device, 'role')
-                                    LOGGER.debug(f"Zone role consistency: Device '{device_name}' (serial: {device_serial}, current role: {current_role})")
+                                    LOGGER.debug("Zone role consistency: Device '%s' (serial: %s, current role: %s)", device_name, device_serial, current_role)
 
                                     # Apply the same role changes as in the rooms array
                                     # This ensures zones array is consistent with rooms array changes
                                     if device_serial == new_master_serial:
                                         updated_device["role"] = "Master"
-                                        LOGGER.debug(f"Zone: Setting {device_name} to Master role")
+                                        LOGGER.debug("Zone: Setting %s to Master role", device_name)
                                     elif device_serial == old_master_serial:
                                         api_role = self._map_internal_role_to_api(new_master_original_role)
                                         updated_device["role"] = api_role
-                                        LOGGER.debug(f"Zone: Setting {device_name} to {api_role} role")
+                                        LOGGER.debug("Zone: Setting %s to %s role", device_name, api_role)
                                     else:
                                         # Keep existing role but ensure it's properly mapped
                                         api_role = self._map_internal_role_to_api(current_role)
                                         updated_device["role"] = api_role
-                                        LOGGER.debug(f"Zone: Mapped role '{current_role}' to '{api_role}' for {device_name}")
+                                        LOGGER.debug("Zone: Mapped role '%s' to '%s' for %s", current_role, api_role, device_name)
 
                                     updated_devices.append(updated_device)
                                 updated_room["devices"] = updated_devices
@@ -691,12 +685,12 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                             device_serial = get_value(device, 'serial_number') or get_value(device, 'serialNumber')
                             if device_serial == new_master_serial:
                                 device_config["role"] = "Master"
-                                LOGGER.debug(f"Setting {get_value(device, 'name')} to Master role")
+                                LOGGER.debug("Setting %s to Master role", get_value(device, 'name'))
                             elif device_serial == old_master_serial:
                                 # Map internal roles to API roles
                                 api_role = self._map_internal_role_to_api(new_master_original_role)
                                 device_config["role"] = api_role
-                                LOGGER.debug(f"Setting {get_value(device, 'name')} to {api_role} role (from original: {new_master_original_role})")
+                                LOGGER.debug("Setting %s to %s role (from original: %s)", get_value(device, 'name'), api_role, new_master_original_role)
                             else:
                                 # Keep existing role or default to slave
                                 current_role = get_value(device, 'role', 'slave')
@@ -715,11 +709,11 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
 
                     house_config["rooms"].append(room_config)
 
-            LOGGER.debug(f"Created house configuration with {len(house_config['rooms'])} rooms")
+            LOGGER.debug("Created house configuration with %s rooms", len(house_config['rooms']))
             return house_config
 
         except Exception as e:
-            LOGGER.error(f"Failed to create house configuration: {e}")
+            LOGGER.error("Failed to create house configuration: %s", e)
             return None
 
     def _map_internal_role_to_api(self, internal_role: str) -> str:
@@ -735,15 +729,15 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
         normalized_role = internal_role.lower().strip()
         api_role = role_mapping.get(normalized_role, 'SlaveOppositeMaster')
 
-        LOGGER.debug(f"Mapped internal role '{internal_role}' to API role '{api_role}'")
+        LOGGER.debug("Mapped internal role '%s' to API role '%s'", internal_role, api_role)
         return api_role
 
     def _show_configuration_info(self, zone_name: str, is_configurable: bool):
         """Show information about zone configuration capabilities."""
         if is_configurable:
-            LOGGER.info(f"{zone_name}: Master device role change applied via house configuration API - verify in Ambientika app")
+            LOGGER.info("%s: Master device role change applied via house configuration API - verify in Ambientika app", zone_name)
         else:
-            LOGGER.info(f"{zone_name}: Single device zone - master role cannot be changed")
+            LOGGER.info("%s: Single device zone - master role cannot be changed", zone_name)
 
     async def _try_alternative_role_update(self, old_master_device, new_master_device, new_master_original_role: str) -> bool:
         """Try alternative methods for updating device roles."""
@@ -773,7 +767,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
             return False
 
         except Exception as e:
-            LOGGER.error(f"Exception during alternative role update: {e}")
+            LOGGER.error("Exception during alternative role update: %s", e)
             return False
 
     async def _try_house_put_update(self, old_master_device, new_master_device, new_master_original_role: str) -> bool:
@@ -804,11 +798,11 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                 LOGGER.info("House PUT update succeeded")
                 return True
             else:
-                LOGGER.debug(f"House PUT update failed: {result}")
+                LOGGER.debug("House PUT update failed: %s", result)
                 return False
 
         except Exception as e:
-            LOGGER.debug(f"Exception during house PUT update: {e}")
+            LOGGER.debug("Exception during house PUT update: %s", e)
             return False
 
     async def _try_zone_config_update(self, old_master_device, new_master_device, new_master_original_role: str) -> bool:
@@ -824,7 +818,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                 LOGGER.debug("Devices in different zones, skipping zone configuration")
                 return False
 
-            LOGGER.debug(f"Trying zone configuration update for zone {old_master_zone}")
+            LOGGER.debug("Trying zone configuration update for zone %s", old_master_zone)
 
             # Try zone-specific endpoints if they exist
             zone_endpoints = [
@@ -835,7 +829,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
 
             for endpoint in zone_endpoints:
                 try:
-                    LOGGER.debug(f"Trying endpoint: {endpoint}")
+                    LOGGER.debug("Trying endpoint: %s", endpoint)
                     result = await api_client._api.post(endpoint, {
                         "masterId": new_master_device.serial_number,
                         "oldMasterId": old_master_device.serial_number,
@@ -844,19 +838,19 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                     })
 
                     if isinstance(result, Success):
-                        LOGGER.info(f"Zone configuration update succeeded via {endpoint}")
+                        LOGGER.info("Zone configuration update succeeded via %s", endpoint)
                         return True
                     else:
-                        LOGGER.debug(f"Zone endpoint {endpoint} failed: {result}")
+                        LOGGER.debug("Zone endpoint %s failed: %s", endpoint, result)
 
                 except Exception as e:
-                    LOGGER.debug(f"Exception with endpoint {endpoint}: {e}")
+                    LOGGER.debug("Exception with endpoint %s: %s", endpoint, e)
                     continue
 
             return False
 
         except Exception as e:
-            LOGGER.debug(f"Exception during zone configuration update: {e}")
+            LOGGER.debug("Exception during zone configuration update: %s", e)
             return False
 
     async def _try_device_role_update(self, old_master_device, new_master_device, new_master_original_role: str) -> bool:
@@ -883,7 +877,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                     LOGGER.info("Successfully updated both device roles individually")
                     return True
                 else:
-                    LOGGER.debug(f"Failed to update old master role: {old_master_update}")
+                    LOGGER.debug("Failed to update old master role: %s", old_master_update)
                     # Try to rollback new master
                     await api_client._api.post(
                         f"devices/{new_master_device.serial_number}/role",
@@ -891,11 +885,11 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                     )
                     return False
             else:
-                LOGGER.debug(f"Failed to update new master role: {new_master_update}")
+                LOGGER.debug("Failed to update new master role: %s", new_master_update)
                 return False
 
         except Exception as e:
-            LOGGER.debug(f"Individual device role update strategy failed: {e}")
+            LOGGER.debug("Individual device role update strategy failed: %s", e)
             return False
 
     async def _try_operating_mode_fallback(self, old_master_device, new_master_device, new_master_original_role: str) -> bool:
@@ -922,7 +916,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
             result = await new_master_device.change_mode(new_master_mode)
 
             if isinstance(result, Success):
-                LOGGER.debug(f"Set {new_master_device.name} to MasterSlaveFlow mode")
+                LOGGER.debug("Set %s to MasterSlaveFlow mode", new_master_device.name)
 
                 # Wait for the change to propagate
                 await asyncio.sleep(2)
@@ -943,24 +937,24 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                     "humidity_level": old_status.get("humidity_level", 1),
                 }
 
-                LOGGER.debug(f"Setting {old_master_device.name} to {target_role_description}")
+                LOGGER.debug("Setting %s to %s", old_master_device.name, target_role_description)
                 result2 = await old_master_device.change_mode(old_slave_mode)
 
                 if isinstance(result2, Success):
-                    LOGGER.info(f"Operating mode fallback completed: {new_master_device.name} -> master, {old_master_device.name} -> {target_role_description}")
+                    LOGGER.info("Operating mode fallback completed: %s -> master, %s -> %s", new_master_device.name, old_master_device.name, target_role_description)
 
                     # For operating mode changes, success is indicated by successful mode changes
                     # The API roles might not update immediately, so we don't rely on role validation
                     return True
                 else:
-                    LOGGER.debug(f"Failed to set old master operating mode: {result2}")
+                    LOGGER.debug("Failed to set old master operating mode: %s", result2)
                     return False
             else:
-                LOGGER.debug(f"Failed to set new master operating mode: {result}")
+                LOGGER.debug("Failed to set new master operating mode: %s", result)
                 return False
 
         except Exception as e:
-            LOGGER.debug(f"Operating mode fallback strategy failed: {e}")
+            LOGGER.debug("Operating mode fallback strategy failed: %s", e)
             return False
 
     def _create_updated_house_config(self, house, old_master_serial: str, new_master_serial: str, new_master_original_role: str) -> dict:
@@ -974,16 +968,18 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                 "rooms": []
             }
 
-            if hasattr(house, 'rooms'):
-                for room in house.rooms:
+            rooms = getattr(house, 'rooms', None)
+            if rooms is not None:
+                for room in rooms:
                     room_config = {
                         "id": room.id,
                         "name": room.name,
                         "devices": []
                     }
 
-                    if hasattr(room, 'devices'):
-                        for device in room.devices:
+                    devices = getattr(room, 'devices', None)
+                    if devices is not None:
+                        for device in devices:
                             device_config = {
                                 "serial_number": device.serial_number,
                                 "name": device.name,
@@ -1004,7 +1000,7 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
             return config
 
         except Exception as e:
-            LOGGER.debug(f"Failed to create updated house configuration: {e}")
+            LOGGER.debug("Failed to create updated house configuration: %s", e)
             return None
 
     async def _validate_role_change(self, new_master_serial: str, old_master_serial: str, expected_old_role: str) -> bool:
@@ -1033,13 +1029,13 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
                     old_master_name = device.name
 
             LOGGER.debug("Role validation results:")
-            LOGGER.debug(f"  New master {new_master_name} ({new_master_serial}): role = '{new_master_role}'")
-            LOGGER.debug(f"  Former master {old_master_name} ({old_master_serial}): role = '{old_master_role}'")
-            LOGGER.debug(f"  Expected former master role: '{expected_old_role}'")
+            LOGGER.debug("  New master %s (%s): role = '%s'", new_master_name, new_master_serial, new_master_role)
+            LOGGER.debug("  Former master %s (%s): role = '%s'", old_master_name, old_master_serial, old_master_role)
+            LOGGER.debug("  Expected former master role: '%s'", expected_old_role)
 
             # Validate that new device has master role
             if new_master_role != 'master':
-                LOGGER.warning(f"New master device role is '{new_master_role}', expected 'master'")
+                LOGGER.warning("New master device role is '%s', expected 'master'", new_master_role)
                 return False
 
             # Validate that old master has the expected role
@@ -1057,25 +1053,25 @@ class ZoneMasterDeviceSelectBase(CoordinatorEntity, SelectEntity):
             )
 
             if not role_matches:
-                LOGGER.warning(f"Former master role is '{old_master_role}', expected '{expected_old_role}' or compatible")
+                LOGGER.warning("Former master role is '%s', expected '%s' or compatible", old_master_role, expected_old_role)
                 # Still return True if new master is correct - the role swap may have succeeded partially
                 return new_master_role == 'master'
 
             LOGGER.info("Role change validation successful:")
-            LOGGER.info(f"  ✓ {new_master_name} is now Master")
-            LOGGER.info(f"  ✓ {old_master_name} is now {old_master_role.title()}")
+            LOGGER.info("  ✓ %s is now Master", new_master_name)
+            LOGGER.info("  ✓ %s is now %s", old_master_name, old_master_role.title())
             return True
 
         except Exception as e:
-            LOGGER.error(f"Role change validation failed with exception: {e}")
+            LOGGER.error("Role change validation failed with exception: %s", e)
             return False
 
     def _show_configuration_info(self, zone_name: str, is_configurable: bool):
         """Show information about zone configuration capabilities."""
         if is_configurable:
-            LOGGER.info(f"{zone_name}: Master device selection attempted - please verify in Ambientika app")
+            LOGGER.info("%s: Master device selection attempted - please verify in Ambientika app", zone_name)
         else:
-            LOGGER.info(f"{zone_name}: Single device zone - master role cannot be changed")
+            LOGGER.info("%s: Single device zone - master role cannot be changed", zone_name)
 
 
 class ZoneMasterDeviceSelect(ZoneMasterDeviceSelectBase):
@@ -1171,7 +1167,7 @@ class ZoneMasterDeviceSelect(ZoneMasterDeviceSelectBase):
     async def async_select_option(self, option: str) -> None:
         """Change the selected master device."""
         if self._update_in_progress:
-            LOGGER.warning(f"Update already in progress for {self._attr_name}")
+            LOGGER.warning("Update already in progress for %s", self._attr_name)
             return
 
         self._update_in_progress = True
@@ -1180,7 +1176,7 @@ class ZoneMasterDeviceSelect(ZoneMasterDeviceSelectBase):
             self._refresh_zone_info()
 
             if not self._zone_info.is_configurable:
-                LOGGER.warning(f"Zone {self._zone_info.zone_name} is not configurable (single device)")
+                LOGGER.warning("Zone %s is not configurable (single device)", self._zone_info.zone_name)
                 self._show_configuration_info(self._zone_info.zone_name, False)
                 return
 
@@ -1198,39 +1194,48 @@ class ZoneMasterDeviceSelect(ZoneMasterDeviceSelectBase):
                     break
 
             if not selected_device_serial:
-                LOGGER.error(f"Could not find device for option: {option}")
+                LOGGER.error("Could not find device for option: %s", option)
                 return
 
             # Check if this is already the master
             if selected_device_serial == self._zone_info.current_master_serial:
-                LOGGER.info(f"Device {selected_device_name} is already the master for {self._zone_info.zone_name}")
+                LOGGER.info("Device %s is already the master for %s", selected_device_name, self._zone_info.zone_name)
                 return
 
             current_master_serial = self._zone_info.current_master_serial
             if not current_master_serial:
-                LOGGER.error(f"No current master found for {self._zone_info.zone_name}")
+                LOGGER.error("No current master found for %s", self._zone_info.zone_name)
                 return
 
-            LOGGER.info(f"Attempting to change master for {self._zone_info.zone_name} from "
-                       f"{self._zone_info.current_master_name} to {selected_device_name}")
+            LOGGER.info(
+                "Attempting to change master for %s from %s to %s",
+                self._zone_info.zone_name,
+                self._zone_info.current_master_name,
+                selected_device_name,
+            )
 
             # Attempt the master change
             success = await self._attempt_master_change(current_master_serial, selected_device_serial)
 
             if success:
-                LOGGER.info(f"Master change completed for {self._zone_info.zone_name}. "
-                           "Please verify the change in the Ambientika mobile app.")
+                LOGGER.info(
+                    "Master change completed for %s. Please verify the change in the Ambientika mobile app.",
+                    self._zone_info.zone_name,
+                )
                 self._show_configuration_info(self._zone_info.zone_name, True)
             else:
-                LOGGER.warning(f"Master change attempt may not have succeeded for {self._zone_info.zone_name}. "
-                              "This may be a limitation of the Ambientika API. "
-                              "Use the Ambientika mobile app for definitive master device configuration.")
+                LOGGER.warning(
+                    "Master change attempt may not have succeeded for %s. "
+                    "This may be a limitation of the Ambientika API. "
+                    "Use the Ambientika mobile app for definitive master device configuration.",
+                    self._zone_info.zone_name,
+                )
 
                 # Still show the configuration info
                 self._show_configuration_info(self._zone_info.zone_name, True)
 
         except Exception as e:
-            LOGGER.error(f"Error selecting master device option {option} for {self._zone_info.zone_name}: {e}")
+            LOGGER.error("Error selecting master device option %s for %s: %s", option, self._zone_info.zone_name, e)
 
         finally:
             self._update_in_progress = False
@@ -1330,6 +1335,6 @@ class GlobalMasterDeviceSelect(ZoneMasterDeviceSelectBase):
 
     async def async_select_option(self, option: str) -> None:
         """Handle selection - informational only for global mode."""
-        LOGGER.info(f"Global master device selection: {option}")
+        LOGGER.info("Global master device selection: %s", option)
         LOGGER.info("Master device selection requires zone configuration. "
                    "Please configure zones in the Ambientika mobile app for active master device management.")
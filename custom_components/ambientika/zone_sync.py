@@ -25,7 +25,7 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, MANUFACTURER
 from .hub import AmbientikaHub
 
 # Sync configuration constants
@@ -193,7 +193,7 @@ class AmbientikaZoneSync:
                         zones = getattr(house_data, 'zones', [])
                         house_rooms = getattr(house_data, 'rooms', [])
 
-                    self._logger.debug(f"Processing house {house_name} with {len(zones)} zones")
+                    self._logger.debug("Processing house %s with %s zones", house_name, len(zones))
 
                     # Get zone information and room information
                     zones_data = {}
@@ -211,7 +211,7 @@ class AmbientikaZoneSync:
                                 zone_name = getattr(zone, 'name', f'Zone {zone_id}')
                                 zone_rooms = getattr(zone, 'rooms', [])
 
-                            self._logger.debug(f"Processing zone {zone_id} ({zone_name}) with {len(zone_rooms)} rooms")
+                            self._logger.debug("Processing zone %s (%s) with %s rooms", zone_id, zone_name, len(zone_rooms))
 
                             # Process rooms in this zone
                             for room in zone_rooms:
@@ -294,7 +294,7 @@ class AmbientikaZoneSync:
                             )
 
                             self._zone_mappings[zone_id] = mapping
-                            self._logger.debug(f"Created zone mapping for zone {zone_id} with {len(zone_data['devices'])} devices")
+                            self._logger.debug("Created zone mapping for zone %s with %s devices", zone_id, len(zone_data['devices']))
 
                         self._logger.debug("Processed house %s with %d zones", house_name, len(zones_data))
                     else:
@@ -332,8 +332,9 @@ class AmbientikaZoneSync:
                 room_name = None
                 if hasattr(self.hub, '_zone_data') and self.hub._zone_data:
                     for house in self.hub._zone_data:
-                        if hasattr(house, 'rooms'):
-                            for room in house.rooms:
+                        rooms = getattr(house, 'rooms', None)
+                        if rooms is not None:
+                            for room in rooms:
                                 if room.id == room_id:
                                     room_name = room.name
                                     break
@@ -481,7 +482,7 @@ class AmbientikaZoneSync:
                 self._logger.info("Floor creation criteria not met, skipping floor creation")
                 return floors_created
 
-            self._logger.debug(f"Creating floors for zones: {sorted(zones_to_create_floors)}")
+            self._logger.debug("Creating floors for zones: %s", sorted(zones_to_create_floors))
 
             for zone_id in zones_to_create_floors:
                 # Determine floor name
@@ -767,6 +768,12 @@ class ZoneSyncSensor(CoordinatorEntity, SensorEntity):
     _attr_name = "Zone Synchronization"
     _attr_icon = "mdi:sync"
     _attr_should_poll = False
+    _attr_device_info = {
+        "identifiers": {(DOMAIN, "zone_sync")},
+        "name": "Ambientika Zone Synchronization",
+        "manufacturer": MANUFACTURER,
+        "model": "Zone Sync Manager",
+    }
 
     def __init__(self, coordinator: AmbientikaHub, config: dict[str, Any], zone_sync: AmbientikaZoneSync) -> None:
         """Initialize the zone sync sensor."""
@@ -775,16 +782,6 @@ class ZoneSyncSensor(CoordinatorEntity, SensorEntity):
         self._zone_sync = zone_sync
         self._attr_unique_id = f"{DOMAIN}_zone_sync_status"
 
-    @property
-    def device_info(self):
-        """Return device info for the integration."""
-        return {
-            "identifiers": {(DOMAIN, "zone_sync")},
-            "name": "Ambientika Zone Synchronization",
-            "manufacturer": "SUEDWIND",
-            "model": "Zone Sync Manager",
-        }
-
     @property
     def state(self) -> str:
         """Return the state of the zone sync sensor."""
@@ -818,5 +815,5 @@ class ZoneSyncSensor(CoordinatorEntity, SensorEntity):
             }
 
         except Exception as e:
-            LOGGER.error(f"Error generating zone sync attributes: {e}")
+            LOGGER.error("Error generating zone sync attributes: %s", e)
             return {"error": str(e), "error_type": "attribute_generation_failed"}
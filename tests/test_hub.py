@@ -0,0 +1,45 @@
+"""Tests for the device status handling of the Ambientika hub."""
+
+from types import SimpleNamespace
+
+import pytest
+from returns.result import Failure, Success
+
+from custom_components.ambientika.const import (
+    AmbientikaApiClientAuthenticationError,
+    AmbientikaApiClientRateLimitError,
+)
+from custom_components.ambientika.hub import AmbientikaHub
+
+
+@pytest.mark.parametrize(
+    ("status_code", "error"),
+    [
+        (401, AmbientikaApiClientAuthenticationError),
+        (429, AmbientikaApiClientRateLimitError),
+    ],
+)
+def test_status_failure_of_the_account_fails_the_refresh(status_code, error) -> None:
+    """A 401 or 429 on a status request is raised, even though the API returns it as a Failure."""
+    devices = (SimpleNamespace(serial_number="1"), SimpleNamespace(serial_number="2"))
+    results = [
+        Success({"temperature": 21}),
+        Failure({"status_code": status_code, "data": None}),
+    ]
+
+    with pytest.raises(error):
+        AmbientikaHub._apply_device_status(devices, results)
+
+
+def test_other_status_failure_only_affects_its_device() -> None:
+    """Any other failed status request leaves the other devices updated."""
+    updated = SimpleNamespace(serial_number="1")
+    failed = SimpleNamespace(serial_number="2")
+
+    AmbientikaHub._apply_device_status(
+        (updated, failed),
+        [Success({"temperature": 21}), Failure({"status_code": 500, "data": None})],
+    )
+
+    assert updated.current_status == {"temperature": 21}
+    assert not hasattr(failed, "current_status")